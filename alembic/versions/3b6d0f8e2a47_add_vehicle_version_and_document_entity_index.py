@@ -0,0 +1,26 @@
+"""add_vehicle_version_and_document_entity_index
+
+Revision ID: 3b6d0f8e2a47
+Revises: e91f0a3c7b18
+Create Date: 2026-10-18 10:12:44.508312
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '3b6d0f8e2a47'
+down_revision = 'e91f0a3c7b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Row version bumped on every vehicle write; feeds the owner vehicle list ETag
+    op.add_column('vehicles', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    # Serves both the document list and its version (ETag) query
+    op.create_index('ix_documents_entity', 'documents', ['entity_type', 'entity_id', 'is_deleted'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_entity', table_name='documents')
+    op.drop_column('vehicles', 'version')
@@ -0,0 +1,31 @@
+"""add_media_document_url_content_hash
+
+Revision ID: 5f81c3a9d274
+Revises: 7d2a9c4e1f06
+Create Date: 2026-10-18 16:21:49.530418
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '5f81c3a9d274'
+down_revision = '7d2a9c4e1f06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Content-addressed storage: one row (and one file) per distinct document image
+    op.add_column('media_documents_urls', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('media_documents_urls', sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False))
+    # Looks up an upload's row by hash and keeps concurrent uploads of one image on a single row
+    op.create_index('ix_media_documents_urls_content_hash', 'media_documents_urls', ['content_hash'], unique=True)
+    # Lets the collector find unreferenced rows without a scan
+    op.create_index('ix_media_documents_urls_ref_count', 'media_documents_urls', ['ref_count'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_media_documents_urls_ref_count', table_name='media_documents_urls')
+    op.drop_index('ix_media_documents_urls_content_hash', table_name='media_documents_urls')
+    op.drop_column('media_documents_urls', 'ref_count')
+    op.drop_column('media_documents_urls', 'content_hash')
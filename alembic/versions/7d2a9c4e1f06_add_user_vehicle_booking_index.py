@@ -0,0 +1,26 @@
+"""add_user_vehicle_booking_index
+
+Revision ID: 7d2a9c4e1f06
+Revises: 3b6d0f8e2a47
+Create Date: 2026-10-18 14:03:27.114905
+
+"""
+from alembic import op
+
+revision = '7d2a9c4e1f06'
+down_revision = '3b6d0f8e2a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the locked overlap check of a new booking and the booking index load
+    op.create_index(
+        'ix_user_vehicles_booking',
+        'user_vehicles',
+        ['vehicle_id', 'ownership_type', 'ownership_status', 'ownership_start_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_vehicles_booking', table_name='user_vehicles')
@@ -0,0 +1,27 @@
+"""add_user_token_version
+
+Revision ID: a7c31e9d4b52
+Revises: 50573e5f27fe, convert_postgresql_to_mysql
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'a7c31e9d4b52'
+down_revision = ('50573e5f27fe', 'convert_postgresql_to_mysql')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-user token version embedded in access tokens; bumping it revokes older tokens
+    op.add_column('users', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+    # The revocation map is refreshed incrementally by modified_date
+    op.create_index('ix_users_modified_date', 'users', ['modified_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_modified_date', table_name='users')
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,46 @@
+"""add_vehicle_search_indexes
+
+Revision ID: c4e8b2f61d90
+Revises: a7c31e9d4b52
+Create Date: 2026-10-17 11:03:27.884215
+
+"""
+from alembic import op
+
+revision = 'c4e8b2f61d90'
+down_revision = 'a7c31e9d4b52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite indexes for /api/v1/vehicles/search, one per combination of the equality
+    # filters (availability_status, type, rental_duration): those columns first, then
+    # rental_price for the price range and (rental_price, id) result ordering
+    op.create_index('ix_vehicles_search_status_type_duration', 'vehicles',
+                    ['is_deleted', 'availability_status', 'type', 'rental_duration', 'rental_price'])
+    op.create_index('ix_vehicles_search_status_type', 'vehicles',
+                    ['is_deleted', 'availability_status', 'type', 'rental_price'])
+    op.create_index('ix_vehicles_search_status_duration', 'vehicles',
+                    ['is_deleted', 'availability_status', 'rental_duration', 'rental_price'])
+    op.create_index('ix_vehicles_search_status', 'vehicles',
+                    ['is_deleted', 'availability_status', 'rental_price'])
+    op.create_index('ix_vehicles_search_type_duration', 'vehicles',
+                    ['is_deleted', 'type', 'rental_duration', 'rental_price'])
+    op.create_index('ix_vehicles_search_type', 'vehicles',
+                    ['is_deleted', 'type', 'rental_price'])
+    op.create_index('ix_vehicles_search_duration', 'vehicles',
+                    ['is_deleted', 'rental_duration', 'rental_price'])
+    op.create_index('ix_vehicles_search_price', 'vehicles',
+                    ['is_deleted', 'rental_price'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicles_search_price', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_duration', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_type', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_type_duration', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_status', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_status_duration', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_status_type', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_status_type_duration', table_name='vehicles')
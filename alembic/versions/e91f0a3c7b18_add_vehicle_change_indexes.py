@@ -0,0 +1,24 @@
+"""add_vehicle_change_indexes
+
+Revision ID: e91f0a3c7b18
+Revises: c4e8b2f61d90
+Create Date: 2026-10-18 08:41:09.172603
+
+"""
+from alembic import op
+
+revision = 'e91f0a3c7b18'
+down_revision = 'c4e8b2f61d90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The in-memory availability index is refreshed incrementally by these columns
+    op.create_index('ix_vehicles_added_date', 'vehicles', ['added_date'])
+    op.create_index('ix_vehicles_modified_date', 'vehicles', ['modified_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicles_modified_date', table_name='vehicles')
+    op.drop_index('ix_vehicles_added_date', table_name='vehicles')
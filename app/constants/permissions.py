@@ -1,10 +1,7 @@
 from enum import Enum
-from typing import List, Set
+from typing import Dict, List, Set
 from functools import wraps
-from fastapi import HTTPException, status, Depends
-from sqlalchemy.orm import Session
-
-from ..features.auth.schemas import UserOut
+from fastapi import HTTPException, Request, status
 
 
 class Permission(str, Enum):
@@ -119,6 +116,32 @@ ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
 }
 
 
+# Bitmasks compiled once at import: one bit per permission and per role.
+# Role is a str Enum, so these dicts can be indexed with plain user_type strings.
+PERMISSION_BITS: Dict[Permission, int] = {permission: 1 << i for i, permission in enumerate(Permission)}
+ROLE_BITS: Dict[Role, int] = {role: 1 << i for i, role in enumerate(Role)}
+ROLE_PERMISSION_MASKS: Dict[Role, int] = {
+    role: sum(PERMISSION_BITS[permission] for permission in permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+
+def permission_mask(*permissions: Permission) -> int:
+    """Combine permissions into a single bitmask"""
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
+def role_mask(*roles: Role) -> int:
+    """Combine roles into a single bitmask (unknown roles contribute nothing)"""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
 def get_user_permissions(user_role: str) -> Set[Permission]:
     """Get permissions for a given user role"""
     try:
@@ -131,11 +154,8 @@ def get_user_permissions(user_role: str) -> Set[Permission]:
 
 def has_permission(user_role: str, required_permission: Permission) -> bool:
     """Check if user role has the required permission"""
-    try:
-        user_permissions = get_user_permissions(user_role)
-        return required_permission in user_permissions
-    except Exception:
-        return False
+    required = PERMISSION_BITS.get(required_permission, 0)
+    return bool(required) and ROLE_PERMISSION_MASKS.get(user_role, 0) & required == required
 
 
 def require_permission(permission: Permission):
@@ -193,52 +213,48 @@ def require_role(allowed_roles: List[Role]):
     return decorator
 
 
-# Dependency functions for FastAPI
-async def require_permission_dependency(
-    permission: Permission,
-    current_user: UserOut = Depends(lambda: None)  # This will be injected by the route
-) -> UserOut:
-    """FastAPI dependency to check permissions"""
-    if not current_user:
+def _get_request_user_type(request: Request) -> str:
+    """Get the user type set by AuthMiddleware"""
+    user_type = getattr(request.state, "user_type", None)
+    if user_type is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required"
         )
-    
-    if not has_permission(current_user.type, permission):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Insufficient permissions. Required: {permission.value}"
-        )
-    
-    return current_user
+    return user_type
 
 
-async def require_role_dependency(
-    allowed_roles: List[Role],
-    current_user: UserOut = Depends(lambda: None)  # This will be injected by the route
-) -> UserOut:
-    """FastAPI dependency to check roles"""
-    if not current_user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required"
-        )
-    
-    try:
-        user_role = Role(current_user.type)
-        if user_role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {[role.value for role in allowed_roles]}"
-            )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Invalid user role"
-        )
-    
-    return current_user
+# Dependency functions for FastAPI
+def require_permission_dependency(*permissions: Permission):
+    """
+    FastAPI dependency requiring all given permissions, checked against a mask computed once per route.
+
+    Usage: @router.get(..., dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_READ))])
+    """
+    required = permission_mask(*permissions)
+    detail = f"Insufficient permissions. Required: {', '.join(permission.value for permission in permissions)}"
+
+    async def dependency(request: Request) -> None:
+        if ROLE_PERMISSION_MASKS.get(_get_request_user_type(request), 0) & required != required:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+    return dependency
+
+
+def require_role_dependency(*allowed_roles: Role):
+    """
+    FastAPI dependency requiring one of the given roles, checked against a mask computed once per route.
+
+    Usage: @router.get(..., dependencies=[Depends(require_role_dependency(Role.OWNER, Role.ADMIN))])
+    """
+    allowed = role_mask(*allowed_roles)
+    detail = f"Access denied. Required roles: {[role.value for role in allowed_roles]}"
+
+    async def dependency(request: Request) -> None:
+        if not ROLE_BITS.get(_get_request_user_type(request), 0) & allowed:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+    return dependency
 
 
 # Convenience functions for common role checks
@@ -10,6 +10,50 @@ class Settings:
         self.algorithm: str = os.getenv("ALGORITHM", "HS256")
         self.access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+        # Connection pool
+        self.db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.db_pool_liveness: str = self._get_pool_liveness()
+
+        # Authenticated-user cache
+        self.auth_user_cache_size: int = int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"))
+        self.auth_user_cache_ttl_seconds: float = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+        self.jwt_cache_size: int = int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+        # Auth mode: "lookup" checks the users table (via the user cache) on each request,
+        # "stateless" trusts token claims and checks an in-memory revocation map
+        self.auth_mode: str = self._get_auth_mode()
+        self.auth_revocation_refresh_seconds: float = float(os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", "5"))
+
+        # In-memory vehicle availability index
+        self.availability_index_refresh_seconds: float = float(os.getenv("AVAILABILITY_INDEX_REFRESH_SECONDS", "10"))
+
+        # Largest document file accepted per upload, in bytes
+        self.document_upload_max_bytes: int = int(os.getenv("DOCUMENT_UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+        # Threads decoding and writing document files; bounds concurrent disk writes per process
+        self.document_write_workers: int = int(os.getenv("DOCUMENT_WRITE_WORKERS", "4"))
+        # How often files no document references any more are removed
+        self.document_gc_interval_seconds: float = float(os.getenv("DOCUMENT_GC_INTERVAL_SECONDS", "300"))
+
+        # Password hashing pool (bcrypt releases the GIL, so threads run in parallel)
+        self.password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+    def _get_pool_liveness(self) -> str:
+        """Get connection liveness strategy: pre_ping, recycle or none"""
+        liveness = os.getenv("DB_POOL_LIVENESS", "pre_ping").lower()
+        if liveness not in ("pre_ping", "recycle", "none"):
+            raise ValueError(f"Invalid DB_POOL_LIVENESS: {liveness}")
+        return liveness
+
+    def _get_auth_mode(self) -> str:
+        """Get auth mode: lookup or stateless"""
+        auth_mode = os.getenv("AUTH_MODE", "lookup").lower()
+        if auth_mode not in ("lookup", "stateless"):
+            raise ValueError(f"Invalid AUTH_MODE: {auth_mode}")
+        return auth_mode
+
     def _get_database_url(self) -> str:
         """Get async database URL from environment variables"""
         db_user = os.getenv("DB_USER", "root")
@@ -1,15 +1,27 @@
 import os
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Awaitable, Callable
 from dotenv import load_dotenv
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
+from .config import get_settings
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, get_pool_status
+
 # Load environment variables
 load_dotenv()
 
 # Create declarative base
 Base = declarative_base()
 
+# modified_date is stamped at flush but a row only becomes visible at commit, so it can land
+# behind a reader's last sync time. Readers polling modified_date for changes re-read this window.
+LATE_COMMIT_WINDOW = timedelta(seconds=30)
+
 def get_database_config():
     """Get database configuration from environment variables"""
     return {
@@ -30,14 +42,44 @@ def get_database_url():
     )
 
 
+def get_async_database_url():
+    """Get async (aiomysql) database URL from settings"""
+    return get_settings().database_url
+
+
+def get_pool_options():
+    """Get connection pool options from settings"""
+    settings = get_settings()
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        # -1 disables recycling in SQLAlchemy
+        "pool_recycle": -1 if settings.db_pool_liveness == "none" else settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": settings.db_pool_liveness == "pre_ping",
+    }
+
+
 def create_database_engine():
     """Create sync database engine"""
     return create_engine(
         get_database_url(),
         echo=False,
-        pool_pre_ping=True,
+        poolclass=TimedQueuePool,
+        **get_pool_options(),
     )
 
+
+def create_async_database_engine():
+    """Create async database engine"""
+    return create_async_engine(
+        get_async_database_url(),
+        echo=False,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **get_pool_options(),
+    )
+
+
 def create_session_local():
     """Create sync session local"""
     return sessionmaker(
@@ -47,11 +89,24 @@ def create_session_local():
     )
 
 
+def create_async_session_local():
+    """Create async session local"""
+    return async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        # Keep attributes loaded after commit so no implicit IO happens on access
+        expire_on_commit=False,
+    )
+
+
 # Create engine instances
 engine = create_database_engine()
+async_engine = create_async_database_engine()
 
 # Create session locals
 SessionLocal = create_session_local()
+AsyncSessionLocal = create_async_session_local()
 
 
 def get_db_session():
@@ -60,4 +115,78 @@ def get_db_session():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_db_pool_status():
+    """Get pool counters for the sync and async engines"""
+    return {
+        "sync": get_pool_status(engine.pool),
+        "async": get_pool_status(async_engine.sync_engine.pool),
+    }
+
+
+def get_request_db_session(request: Request) -> AsyncSession:
+    """Get the request-scoped async session, opening it on first use"""
+    db = getattr(request.state, "db", None)
+    if db is None:
+        db = AsyncSessionLocal()
+        request.state.db = db
+    return db
+
+
+async def close_request_db_session(request: Request) -> None:
+    """Close the request-scoped async session if one was opened"""
+    db = getattr(request.state, "db", None)
+    if db is not None:
+        request.state.db = None
+        await db.close()
+
+
+async def get_async_db_session(request: Request):
+    """Dependency to get the request-scoped async database session"""
+    if getattr(request.state, "db", None) is not None:
+        # Opened by AuthMiddleware, which also closes it
+        yield request.state.db
+        return
+
+    db = get_request_db_session(request)
+    try:
+        yield db
+    finally:
+        await close_request_db_session(request)
+
+
+def on_rollback(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Undo a side effect outside the database if the current unit of work rolls back. The
+    callback runs before the rollback, while the transaction still holds its row locks.
+    """
+    db.info.setdefault("rollback_callbacks", []).append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession):
+    """
+    Transaction boundary for one API operation: commits once if the block succeeds and
+    rolls back if it raises. Code inside only flushes; nested blocks join the outer one.
+    """
+    depth = db.info.get("unit_of_work_depth", 0)
+    db.info["unit_of_work_depth"] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            await db.commit()
+    except BaseException:
+        if depth == 0:
+            for callback in db.info.pop("rollback_callbacks", []):
+                try:
+                    await callback()
+                except Exception as e:
+                    print(f"Error undoing work of a rolled back transaction: {str(e)}")
+            await db.rollback()
+        raise
+    finally:
+        db.info["unit_of_work_depth"] = depth
+        if depth == 0:
+            db.info.pop("rollback_callbacks", None)
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class MeteredExecutor:
+    """Size-limited thread pool that tracks queue depth and wait/run times"""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queue_depth = 0
+        self.wait_total = 0.0
+        self.run_total = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) on the pool without blocking the event loop"""
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            if self.queued > self.max_queue_depth:
+                self.max_queue_depth = self.queued
+
+        def call():
+            started = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_total += started - submitted
+            ok = False
+            try:
+                result = func(*args)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.run_total += time.perf_counter() - started
+                    if ok:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+
+        def forget_if_cancelled(future):
+            # A job cancelled before it started (its caller was cancelled) never runs call()
+            if future.cancelled():
+                with self._lock:
+                    self.queued -= 1
+
+        future = self._executor.submit(call)
+        future.add_done_callback(forget_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self.completed + self.failed
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queue_depth": self.max_queue_depth,
+                "completed": self.completed,
+                "failed": self.failed,
+                "wait_avg_ms": round(self.wait_total * 1000 / done, 3) if done else 0.0,
+                "run_avg_ms": round(self.run_total * 1000 / done, 3) if done else 0.0,
+            }
@@ -1,13 +1,19 @@
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 import uuid
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 
-from .db import SessionLocal
+from .config import get_settings
+from .db import get_request_db_session, close_request_db_session
 from ..features.auth.repository import verify_token, get_user_by_id
+from ..features.auth.cache import user_cache
+from ..features.auth.revocation import revocation_map
 from ..features.auth.schemas import UserOut
 
 
+settings = get_settings()
+
 # Default excluded paths for authentication
 DEFAULT_EXCLUDED_PATHS = [
     "/api/v1/auth/register",
@@ -21,15 +27,23 @@ DEFAULT_EXCLUDED_PATHS = [
 ]
 
 
-def is_path_excluded(request_path: str, excluded_paths: list) -> bool:
+# Exact paths and path prefixes, compiled once per middleware instance
+ExcludedPaths = Tuple[FrozenSet[str], Tuple[str, ...]]
+
+
+def compile_excluded_paths(excluded_paths: list) -> ExcludedPaths:
+    """Split excluded paths into an exact-match set and a prefix table (entries ending in "*")"""
+    exact = frozenset(path for path in excluded_paths if not path.endswith("*"))
+    prefixes = tuple(path[:-1] for path in excluded_paths if path.endswith("*"))
+    return exact, prefixes
+
+
+def is_path_excluded(request_path: str, excluded_paths: ExcludedPaths) -> bool:
     """Check if the request path should be excluded from authentication"""
-    try:
-        print("request_path", request_path)
-        print("excluded_paths", excluded_paths)
-        print("any(request_path == path for path in excluded_paths)", any(request_path == path for path in excluded_paths))
-        return any(request_path == path for path in excluded_paths)
-    except Exception:
-        return False
+    exact, prefixes = excluded_paths
+    if request_path in exact:
+        return True
+    return bool(prefixes) and request_path.startswith(prefixes)
 
 
 def extract_authorization_token(request: Request) -> Optional[str]:
@@ -47,9 +61,21 @@ def extract_authorization_token(request: Request) -> Optional[str]:
         return None
 
 
-async def validate_token_and_user_data(token: str) -> dict:
+async def get_active_user(request: Request, user_id, user_type: str) -> Optional[UserOut]:
+    """Get active user from the cache, falling back to the request-scoped session"""
+    user = user_cache.get(user_id, user_type)
+    if user is not None:
+        return user
+
+    db = get_request_db_session(request)
+    db_user = await get_user_by_id(db, user_id, user_type)
+    if not db_user:
+        return None
+    return user_cache.set(UserOut.model_validate(db_user))
+
+
+async def validate_token_and_user_data(request: Request, token: str) -> dict:
     """Validate JWT token and return user information"""
-    db = SessionLocal()
     try:
         # Verify token and get payload
         payload = verify_token(token)
@@ -72,8 +98,21 @@ async def validate_token_and_user_data(token: str) -> dict:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Get user by ID (more efficient than searching by email)
-        user = await get_user_by_id(db, uuid.UUID(user_id), user_type)
+        # Stateless mode trusts the claims; only the in-memory revocation map is checked
+        if settings.auth_mode == "stateless":
+            if not revocation_map.is_valid(user_id, payload.get("ver", 0)):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token revoked",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return {
+                "user_id": user_id,
+                "user_type": user_type,
+            }
+
+        # Get user by ID (served from the user cache when possible)
+        user = await get_active_user(request, uuid.UUID(user_id), user_type)
                 
         if not user:
             raise HTTPException(
@@ -83,7 +122,7 @@ async def validate_token_and_user_data(token: str) -> dict:
             )
 
         return {
-            "user_id": user.id,
+            "user_id": str(user.id),
             "user_type": user.type,
         }
     except HTTPException:
@@ -94,8 +133,6 @@ async def validate_token_and_user_data(token: str) -> dict:
             detail="Token validation failed",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    finally:
-        db.close()
 
 
 def set_user_in_request_state(request: Request, user_data: dict) -> None:
@@ -111,16 +148,12 @@ def set_user_in_request_state(request: Request, user_data: dict) -> None:
         )
 
 
-async def auth_middleware_dispatch(request: Request, call_next, excluded_paths: list = None):
-    """Functional middleware for authentication"""
+async def authenticate_request(request: Request, excluded_paths: ExcludedPaths) -> None:
+    """Authenticate the request and set user information in request state"""
     try:
-        # Use default excluded paths if none provided
-        excluded_paths = excluded_paths or DEFAULT_EXCLUDED_PATHS
-        
         # Skip authentication for excluded paths
-        if is_path_excluded(request.url.path, excluded_paths):
-            response = await call_next(request)
-            return response
+        if is_path_excluded(request.scope["path"], excluded_paths):
+            return
 
         # Extract token from Authorization header
         token = extract_authorization_token(request)
@@ -133,14 +166,10 @@ async def auth_middleware_dispatch(request: Request, call_next, excluded_paths:
             )
 
         # Validate token and get user
-        user_data = await validate_token_and_user_data(token)
+        user_data = await validate_token_and_user_data(request, token)
         
         # Set user information in request state
         set_user_in_request_state(request, user_data)
-
-        # Continue to the next middleware/route
-        response = await call_next(request)
-        return response
         
     except HTTPException:
         raise
@@ -152,14 +181,32 @@ async def auth_middleware_dispatch(request: Request, call_next, excluded_paths:
         )
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Wrapper class to make functional middleware compatible with FastAPI"""
-    def __init__(self, app, excluded_paths: list = None):
-        super().__init__(app)
-        self.excluded_paths = excluded_paths
+class AuthMiddleware:
+    """Pure ASGI authentication middleware"""
+    def __init__(self, app: ASGIApp, excluded_paths: list = None):
+        self.app = app
+        # Use default excluded paths if none provided
+        self.excluded_paths = compile_excluded_paths(excluded_paths or DEFAULT_EXCLUDED_PATHS)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
-        return await auth_middleware_dispatch(request, call_next, self.excluded_paths)
+        request = Request(scope)
+        try:
+            try:
+                await authenticate_request(request, self.excluded_paths)
+            except HTTPException as e:
+                # Answer directly instead of raising out of the middleware
+                response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+                await response(scope, receive, send)
+                return
+
+            # Continue to the next middleware/route
+            await self.app(scope, receive, send)
+        finally:
+            await close_request_db_session(request)
 
 
 async def get_current_user(request: Request) -> UserOut:
@@ -173,29 +220,16 @@ async def get_current_user(request: Request) -> UserOut:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Get user from database
-        db = SessionLocal()
-        try:
-            user = await get_user_by_id(db, request.state.user_id, request.state.user_type)
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            return UserOut(
-                id=user.id,
-                email=user.email,
-                name=user.name,
-                phone=user.phone,
-                type=user.type,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at
+        # Get user from the user cache (populated by the middleware) or database
+        user = await get_active_user(request, request.state.user_id, request.state.user_type)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
             )
-        finally:
-            db.close()
+            
+        return user
             
     except HTTPException:
         raise
@@ -0,0 +1,90 @@
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Checkout counters and wait times for a connection pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            if wait > self.wait_max:
+                self.wait_max = wait
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_total_ms": round(self.wait_total * 1000, 3),
+                "checkout_wait_avg_ms": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "checkout_wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class _TimedPoolMixin:
+    """Measure how long each checkout waits for a connection"""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        # Keep counters across engine.dispose() / invalidation
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """QueuePool that records checkout metrics"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout metrics"""
+
+
+def get_pool_status(pool) -> dict:
+    """Get current checked-out/idle/overflow counts plus checkout metrics"""
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # overflow() is negative while fewer than pool_size connections exist
+            "overflow": max(pool.overflow(), 0),
+            "timeout": pool.timeout(),
+        })
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends
+
+from ...core.db import get_db_pool_status
+from ..auth.cache import user_cache, token_cache
+from ..auth.repository import password_executor
+from ..documents.storage import document_write_executor
+from ..auth.revocation import revocation_map
+from ..vehicles.availability import availability_index
+from ..bookings.intervals import booking_index
+from ...constants.permissions import Permission, require_permission_dependency
+
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_permission_dependency(Permission.ADMIN_READ))],
+)
+
+
+@router.get("/db-pool")
+async def db_pool_status() -> dict:
+    """
+    Get connection pool usage (checked-out/idle/overflow) and checkout wait times
+    """
+    return get_db_pool_status()
+
+
+@router.get("/auth-cache")
+async def auth_cache_stats() -> dict:
+    """
+    Get authenticated-user and decoded-JWT cache counters and the revocation map state
+    """
+    return {
+        "users": user_cache.stats(),
+        "tokens": token_cache.stats(),
+        "revocations": revocation_map.stats(),
+    }
+
+
+@router.get("/password-hashing")
+async def password_hashing_stats() -> dict:
+    """
+    Get password hashing pool queue depth and timings
+    """
+    return password_executor.stats()
+
+
+@router.get("/document-writes")
+async def document_writes_stats() -> dict:
+    """
+    Get document file write pool queue depth and timings
+    """
+    return document_write_executor.stats()
+
+
+@router.get("/availability-index")
+async def availability_index_stats() -> dict:
+    """
+    Get in-memory vehicle availability index size and last refresh
+    """
+    return availability_index.stats()
+
+
+@router.get("/booking-index")
+async def booking_index_stats() -> dict:
+    """
+    Get in-memory booking interval index size and fast-path counters
+    """
+    return booking_index.stats()
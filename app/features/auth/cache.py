@@ -0,0 +1,152 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ...core.config import get_settings
+from ..models.user import User
+from .schemas import UserOut
+
+
+class ExpiringLRUCache:
+    """Bounded LRU cache whose entries carry an absolute expiry (epoch seconds)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# Every value of users.type; invalidation deletes one key per type instead of scanning the cache
+USER_TYPES = tuple(User.__table__.c.type.type.enums)
+
+
+class UserCache(ExpiringLRUCache):
+    """In-process TTL/LRU cache of active users keyed by (user_id, type)"""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        super().__init__(max_size)
+        self.ttl_seconds = ttl_seconds
+        self.invalidations = 0
+
+    def get(self, user_id, user_type: str) -> Optional[UserOut]:
+        """Get a cached active user, or None on miss/expiry"""
+        return self._get((str(user_id), user_type))
+
+    def set(self, user: UserOut) -> UserOut:
+        """Cache an active user snapshot"""
+        self._set((str(user.id), user.type), user, time.time() + self.ttl_seconds)
+        return user
+
+    def invalidate(self, user_id, user_type: Optional[str] = None) -> None:
+        """Drop a user from the cache (all types when user_type is None)"""
+        user_id = str(user_id)
+        with self._lock:
+            for key_type in (USER_TYPES if user_type is None else (user_type,)):
+                self._entries.pop((user_id, key_type), None)
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats.update({"ttl_seconds": self.ttl_seconds, "invalidations": self.invalidations})
+        return stats
+
+
+class TokenCache(ExpiringLRUCache):
+    """Cache of validated JWT claims keyed by token digest, valid until the token's exp"""
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Get cached claims for a token, or None on miss/expiry"""
+        claims = self._get(self._key(token))
+        return dict(claims) if claims is not None else None
+
+    def set(self, token: str, claims: dict, expires_at: float) -> None:
+        """Cache validated claims until expires_at (the token's exp)"""
+        self._set(self._key(token), dict(claims), expires_at)
+
+
+settings = get_settings()
+user_cache = UserCache(settings.auth_user_cache_size, settings.auth_user_cache_ttl_seconds)
+token_cache = TokenCache(settings.jwt_cache_size)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_status_change(mapper, connection, target: User) -> None:
+    """
+    Evict users whose status, type or soft-delete flag changed through the ORM. This runs at
+    flush, before the commit: a concurrent request could still read the old committed row and
+    cache it again, so the id is also evicted once the transaction commits.
+    """
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in ("status", "is_deleted", "type")):
+        user_cache.invalidate(target.id)
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault("evict_user_ids", set()).add(str(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for user_id in session.info.pop("evict_user_ids", ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_evictions_on_rollback(session: Session, previous_transaction) -> None:
+    # The old row stays current, so nothing cached from it is stale
+    if previous_transaction.parent is None:
+        session.info.pop("evict_user_ids", None)
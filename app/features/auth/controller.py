@@ -1,6 +1,6 @@
 from datetime import timedelta
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .repository import (
     get_user_by_email, create_user, authenticate_user, create_access_token
@@ -11,7 +11,7 @@ from ...constants.permissions import Role, get_user_permissions
 
 access_token_expire_minutes = 24 * 60 # 24 hours
  
-async def register_user(db: Session, user_data: UserRegister) -> dict:
+async def register_user(db: AsyncSession, user_data: UserRegister) -> dict:
     """Register a new user"""
     try:
         # Check if user already exists
@@ -37,7 +37,7 @@ async def register_user(db: Session, user_data: UserRegister) -> dict:
         )
 
 
-async def login_user(db: Session, login_data: UserLogin, type: str) -> Token:
+async def login_user(db: AsyncSession, login_data: UserLogin, type: str) -> Token:
     """Authenticate user and return access token"""
     try:
         user = await authenticate_user(db, login_data.email, login_data.password, type)
@@ -68,6 +68,7 @@ async def login_user(db: Session, login_data: UserLogin, type: str) -> Token:
             data={
                 "user_id": str(user.id),
                 "type": user.type,
+                "ver": user.token_version or 0,
             }, 
             expires_delta=access_token_expires
         )
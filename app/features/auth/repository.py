@@ -2,12 +2,17 @@ from datetime import datetime, timedelta
 from typing import Optional
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from ...core.config import get_settings
+from ...core.db import unit_of_work
+from ...core.executor import MeteredExecutor
 from ..models.user import User
 from .schemas import UserRegister, UserUpdate, PasswordChange
+from .cache import user_cache, token_cache
+from .revocation import revocation_map
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -18,6 +23,9 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
+# Dedicated pool so bcrypt never runs on the event loop
+password_executor = MeteredExecutor("password-hash", settings.password_hash_workers)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -36,6 +44,16 @@ def get_password_hash(password: str) -> str:
         raise Exception(f"Password hashing failed: {str(e)}")
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool"""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the password hashing pool"""
+    return await password_executor.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token with user role and permissions"""
     try:
@@ -51,100 +69,113 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         raise Exception(f"Token creation failed: {str(e)}")
 
 
-async def get_user_by_email(db: Session, email: str, type: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str, type: str) -> Optional[User]:
     """Get user by email"""
     try:
-        return db.query(User).filter(User.email == email, User.is_deleted == False, User.status == 'active', User.type == type).first()
+        result = await db.execute(
+            select(User).filter(User.email == email, User.is_deleted == False, User.status == 'active', User.type == type)
+        )
+        return result.scalars().first()
     except Exception as e:
         raise Exception(f"Failed to get user by email: {str(e)}")
 
 
-async def get_user_by_id(db: Session, user_id: uuid.UUID, type: str) -> Optional[User]:
+async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID, type: str) -> Optional[User]:
     """Get user by ID"""
     try:
-        return db.query(User).filter(User.id == user_id, User.is_deleted == False, User.status == 'active', User.type == type).first()
+        # Compare as str: a UUID value would be bound as dash-less hex against String(36)
+        result = await db.execute(
+            select(User).filter(User.id == str(user_id), User.is_deleted == False, User.status == 'active', User.type == type)
+        )
+        return result.scalars().first()
     except Exception as e:
         raise Exception(f"Failed to get user by ID: {str(e)}")
 
 
-async def create_user(db: Session, user_data: UserRegister) -> None:
+async def create_user(db: AsyncSession, user_data: UserRegister) -> None:
     """Create a new user"""
     try:
-        hashed_password = get_password_hash(user_data.password)
-        user = User(
-            email=user_data.email,
-            password=hashed_password,
-            name=user_data.name,
-            phone=user_data.phone,
-            type=user_data.type,
-            sub_type=None,
-            additional_data={},
-            status='active'  # Default status for new users
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        hashed_password = await get_password_hash_async(user_data.password)
+        async with unit_of_work(db):
+            user = User(
+                email=user_data.email,
+                password=hashed_password,
+                name=user_data.name,
+                phone=user_data.phone,
+                type=user_data.type,
+                sub_type=None,
+                additional_data={},
+                status='active'  # Default status for new users
+            )
+            db.add(user)
+        await db.refresh(user)
     except Exception as e:
-        # Rollback the transaction in case of error
-        db.rollback()
         # Re-raise the exception so it can be handled by the controller
         raise e
 
 
-async def authenticate_user(db: Session, email: str, password: str, type: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str, type: str) -> Optional[User]:
     """Authenticate user with email and password"""
     try:
         user = await get_user_by_email(db, email, type)
         if not user:
             return None
-        if not verify_password(password, user.password):
+        if not await verify_password_async(password, user.password):
             return None
         return user
     except Exception as e:
         raise Exception(f"User authentication failed: {str(e)}")
 
 
-async def update_user(db: Session, user: User, user_data: UserUpdate) -> User:
+async def update_user(db: AsyncSession, user: User, user_data: UserUpdate) -> User:
     """Update user information"""
     try:
-        if user_data.name is not None:
-            user.name = user_data.name
-        if user_data.phone is not None:
-            user.phone = user_data.phone
-        if user_data.sub_type is not None:
-            user.sub_type = user_data.sub_type
-        if user_data.additional_data is not None:
-            user.additional_data = user_data.additional_data
+        async with unit_of_work(db):
+            if user_data.name is not None:
+                user.name = user_data.name
+            if user_data.phone is not None:
+                user.phone = user_data.phone
+            if user_data.sub_type is not None:
+                user.sub_type = user_data.sub_type
+            if user_data.additional_data is not None:
+                user.additional_data = user_data.additional_data
         
-        user.modified_date = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
+            user.modified_date = datetime.utcnow()
+        user_cache.invalidate(user.id, user.type)
+        await db.refresh(user)
         return user
     except Exception as e:
-        db.rollback()
         raise Exception(f"User update failed: {str(e)}")
 
 
-async def change_password(db: Session, user: User, password_data: PasswordChange) -> bool:
+async def change_password(db: AsyncSession, user: User, password_data: PasswordChange) -> bool:
     """Change user password"""
     try:
         # Verify current password
-        if not verify_password(password_data.current_password, user.password):
+        if not await verify_password_async(password_data.current_password, user.password):
             return False
-        
+
         # Update password
-        user.password = get_password_hash(password_data.new_password)
-        user.modified_date = datetime.utcnow()
-        db.commit()
+        new_password = await get_password_hash_async(password_data.new_password)
+        async with unit_of_work(db):
+            user.password = new_password
+            user.modified_date = datetime.utcnow()
+        user_cache.invalidate(user.id, user.type)
+        # token_version was bumped on flush; revoke older tokens on this worker right away
+        revocation_map.apply(user.id, user.token_version, True)
         return True
     except Exception as e:
-        db.rollback()
         raise Exception(f"Password change failed: {str(e)}")
 
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token and return token payload"""
     try:
+        # Tokens are reused for their whole lifetime, so skip re-decoding known ones
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
+
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("user_id")
         user_type: str = payload.get("type")
@@ -159,10 +190,15 @@ def verify_token(token: str) -> Optional[dict]:
             # user_id is not a valid UUID
             return None
             
-        return {
+        claims = {
             "user_id": user_id,
-            "type": user_type
+            "type": user_type,
+            # Tokens issued before versioning carry no "ver"
+            "ver": int(payload.get("ver", 0)),
         }
+        if payload.get("exp") is not None:
+            token_cache.set(token, claims, float(payload["exp"]))
+        return claims
     except JWTError as e:
         # JWT errors are expected for invalid tokens
         return None
@@ -0,0 +1,99 @@
+import asyncio
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import event, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.db import AsyncSessionLocal, LATE_COMMIT_WINDOW
+from ..models.user import User
+
+
+class RevocationMap:
+    """
+    Compact user_id -> minimum valid token version map used by stateless auth.
+
+    Only users with revoked tokens are stored: inactive/deleted users map to REVOKED,
+    users whose token_version was bumped map to that version. Everyone else is absent.
+    """
+
+    REVOKED = sys.maxsize
+
+    def __init__(self):
+        self._min_versions: Dict[str, int] = {}
+        self.synced_at: Optional[datetime] = None
+        self.refreshes = 0
+        self.last_refresh_rows = 0
+        self.last_refresh_ms = 0.0
+
+    def is_valid(self, user_id: str, token_version: int) -> bool:
+        """Check a token's version against the user's minimum valid version"""
+        return token_version >= self._min_versions.get(user_id, 0)
+
+    def apply(self, user_id: str, token_version: int, active: bool) -> None:
+        """Record the current token version / active flag for a user"""
+        user_id = str(user_id)
+        if not active:
+            self._min_versions[user_id] = self.REVOKED
+        elif token_version > 0:
+            self._min_versions[user_id] = token_version
+        else:
+            self._min_versions.pop(user_id, None)
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Load revoked users on first call, then only users modified since the last sync"""
+        started = time.perf_counter()
+        sync_started_at = datetime.utcnow()
+
+        query = select(User.id, User.token_version, User.status, User.is_deleted)
+        if self.synced_at is None:
+            query = query.filter(or_(User.token_version > 0, User.status != 'active', User.is_deleted == True))
+        else:
+            query = query.filter(User.modified_date >= self.synced_at - LATE_COMMIT_WINDOW)
+
+        rows = (await db.execute(query)).all()
+        for user_id, token_version, user_status, is_deleted in rows:
+            self.apply(user_id, token_version or 0, user_status == 'active' and not is_deleted)
+
+        self.synced_at = sync_started_at
+        self.refreshes += 1
+        self.last_refresh_rows = len(rows)
+        self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def stats(self) -> dict:
+        return {
+            "revoked_users": len(self._min_versions),
+            "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+            "refreshes": self.refreshes,
+            "last_refresh_rows": self.last_refresh_rows,
+            "last_refresh_ms": self.last_refresh_ms,
+        }
+
+
+revocation_map = RevocationMap()
+
+
+async def refresh_revocation_map() -> None:
+    """Refresh the revocation map using its own session"""
+    async with AsyncSessionLocal() as db:
+        await revocation_map.refresh(db)
+
+
+async def run_revocation_refresher(interval_seconds: float) -> None:
+    """Background loop that keeps the revocation map current"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await refresh_revocation_map()
+        except Exception as e:
+            print(f"Error refreshing revocation map: {str(e)}")
+
+
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper, connection, target: User) -> None:
+    """Revoke existing tokens when a user's password or role changes"""
+    state = inspect(target)
+    if state.attrs.password.history.has_changes() or state.attrs.type.history.has_changes():
+        target.token_version = (target.token_version or 0) + 1
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, status, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db import get_db_session
+from ...core.db import get_async_db_session
 from ...core.middleware import get_current_user
 from .controller import (
     register_user, login_user
@@ -22,7 +22,7 @@ async def get_current_user_dependency(request: Request) -> UserOut:
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserRegister,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Register a new user"""
     return await register_user(db, user_data)
@@ -31,7 +31,7 @@ async def register(
 # @router.post("/login", response_model=Token)
 # async def login(
 #     login_data: UserLogin,
-#     db: Session = Depends(get_db_session)
+#     db: AsyncSession = Depends(get_async_db_session)
 # ):
 #     """Login user and get access token"""
 #     return await login_user(db, login_data, Role.USER)
@@ -41,7 +41,7 @@ async def register(
 @router.post("/owner/login", response_model=Token)
 async def owner_login(
     login_data: UserLogin,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Login user and get access token"""
     return await login_user(db, login_data, Role.OWNER)
\ No newline at end of file
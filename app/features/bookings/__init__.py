@@ -0,0 +1 @@
+# Bookings feature module
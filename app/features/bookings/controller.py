@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from ...utils.pagination import encode_cursor, decode_cursor
+from ..vehicles.controller import load_quote_rules
+from ..vehicles.repository import is_owner_of_vehicle
+from .intervals import booking_index
+from .schemas import BookingCreate, BookingRow
+from .repository import (
+    is_booking_active,
+    create_booking,
+    cancel_booking as repo_cancel_booking,
+    list_user_bookings,
+    list_vehicle_bookings,
+)
+
+# Tolerate client clock skew when rejecting bookings that start in the past
+START_GRACE = timedelta(minutes=5)
+
+
+def _to_utc_naive(value: datetime) -> datetime:
+    # Booking dates are stored as naive UTC, like every other datetime column
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _status_code_for(error: Exception) -> int:
+    message = str(error)
+    if "conflicts with booking" in message:
+        return status.HTTP_409_CONFLICT
+    if "Not authorized" in message:
+        return status.HTTP_403_FORBIDDEN
+    if "not found" in message.lower():
+        return status.HTTP_404_NOT_FOUND
+    if "already" in message or "maintenance" in message:
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _decode_page_cursor(cursor: Optional[str]) -> Optional[int]:
+    try:
+        after = decode_cursor(cursor, 1)
+        return int(after[0]) if after else None
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def create_new_booking(db: AsyncSession, renter_id: uuid.UUID, data: BookingCreate) -> BookingRow:
+    start, end = _to_utc_naive(data.start), _to_utc_naive(data.end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+    if start < datetime.utcnow() - START_GRACE:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start cannot be in the past")
+
+    # Fail fast on a taken slot without queueing on the vehicle lock
+    conflict_id = booking_index.find_overlap(data.vehicle_id, start, end)
+    if conflict_id is not None:
+        if await is_booking_active(db, conflict_id):
+            booking_index.record_fast_reject()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Slot conflicts with booking {conflict_id}",
+            )
+        # Cancelled by another worker; forget it and let the locked check decide
+        booking_index.record_stale(data.vehicle_id, conflict_id)
+
+    rules = await load_quote_rules(db)
+    try:
+        return await create_booking(db, renter_id, data.vehicle_id, start, end, rules)
+    except Exception as e:
+        raise HTTPException(status_code=_status_code_for(e), detail=str(e))
+
+
+async def cancel_existing_booking(db: AsyncSession, user_id: uuid.UUID, booking_id: int) -> BookingRow:
+    try:
+        return await repo_cancel_booking(db, user_id, booking_id)
+    except Exception as e:
+        raise HTTPException(status_code=_status_code_for(e), detail=str(e))
+
+
+async def get_user_bookings(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str] = None,
+    booking_status: Optional[str] = None,
+) -> Tuple[List[BookingRow], Optional[str]]:
+    before_id = _decode_page_cursor(cursor)
+    try:
+        # Fetch one extra row to know whether another page exists
+        bookings = await list_user_bookings(db, user_id, limit + 1, before_id, booking_status)
+        next_cursor = encode_cursor([bookings[limit - 1]["id"]]) if len(bookings) > limit else None
+        return bookings[:limit], next_cursor
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get bookings: {str(e)}",
+        )
+
+
+async def get_vehicle_bookings(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    vehicle_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str] = None,
+    booking_status: Optional[str] = None,
+) -> Tuple[List[BookingRow], Optional[str]]:
+    before_id = _decode_page_cursor(cursor)
+    if not await is_owner_of_vehicle(db, owner_id, vehicle_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found")
+    try:
+        bookings = await list_vehicle_bookings(db, vehicle_id, limit + 1, before_id, booking_status)
+        next_cursor = encode_cursor([bookings[limit - 1]["id"]]) if len(bookings) > limit else None
+        return bookings[:limit], next_cursor
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get vehicle bookings: {str(e)}",
+        )
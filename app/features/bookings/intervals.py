@@ -0,0 +1,158 @@
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.db import AsyncSessionLocal
+from ..models.user_vehicle import UserVehicle
+
+
+class VehicleIntervals:
+    """Active bookings of one vehicle as parallel lists sorted by start; intervals never overlap"""
+
+    __slots__ = ("starts", "ends", "booking_ids")
+
+    def __init__(self):
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        self.booking_ids: List[int] = []
+
+    def overlap_position(self, start: datetime, end: datetime) -> Optional[int]:
+        # Intervals are disjoint, so ends are sorted too: only the last one starting before `end` can overlap
+        position = bisect_left(self.starts, end)
+        if position and self.ends[position - 1] > start:
+            return position - 1
+        return None
+
+    def drop(self, position: int) -> None:
+        del self.starts[position], self.ends[position], self.booking_ids[position]
+
+
+class BookingIntervalIndex:
+    """
+    In-process index of active bookings: vehicle id -> disjoint [start, end) intervals sorted by start.
+
+    Lets the booking path reject a taken slot with an O(log n) lookup before touching the
+    vehicle row lock. The DB check under that lock stays authoritative: bookings made by other
+    workers are added when they are found there, and cancelled ones are dropped when a
+    lookup hits them, so the index never has to be refreshed on a timer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vehicles: Dict[str, VehicleIntervals] = {}
+        self.ready = False
+        self.loaded_at: Optional[datetime] = None
+        self.fast_rejects = 0
+        self.stale_evictions = 0
+        self.last_load_rows = 0
+        self.last_load_ms = 0.0
+
+    def find_overlap(self, vehicle_id: str, start: datetime, end: datetime) -> Optional[int]:
+        """Booking id of an indexed booking overlapping [start, end), if any"""
+        with self._lock:
+            intervals = self._vehicles.get(str(vehicle_id))
+            position = intervals.overlap_position(start, end) if intervals else None
+            return None if position is None else intervals.booking_ids[position]
+
+    def add(self, vehicle_id: str, booking_id: int, start: datetime, end: datetime) -> None:
+        """Record a booking the DB has accepted, evicting indexed bookings it supersedes"""
+        now = datetime.utcnow()
+        with self._lock:
+            intervals = self._vehicles.setdefault(str(vehicle_id), VehicleIntervals())
+            # The DB just accepted this slot, so anything overlapping it was cancelled elsewhere
+            while (position := intervals.overlap_position(start, end)) is not None:
+                intervals.drop(position)
+                self.stale_evictions += 1
+            # Finished bookings can never conflict again
+            while intervals.ends and intervals.ends[0] <= now:
+                intervals.drop(0)
+            position = bisect_left(intervals.starts, start)
+            intervals.starts.insert(position, start)
+            intervals.ends.insert(position, end)
+            intervals.booking_ids.insert(position, booking_id)
+
+    def remove(self, vehicle_id: str, booking_id: int) -> None:
+        """Drop a cancelled booking"""
+        with self._lock:
+            intervals = self._vehicles.get(str(vehicle_id))
+            if intervals is None:
+                return
+            try:
+                intervals.drop(intervals.booking_ids.index(booking_id))
+            except ValueError:
+                return
+            if not intervals.starts:
+                del self._vehicles[str(vehicle_id)]
+
+    def record_fast_reject(self) -> None:
+        with self._lock:
+            self.fast_rejects += 1
+
+    def record_stale(self, vehicle_id: str, booking_id: int) -> None:
+        self.remove(vehicle_id, booking_id)
+        with self._lock:
+            self.stale_evictions += 1
+
+    async def load(self, db: AsyncSession) -> None:
+        """Rebuild the index from active bookings that have not ended yet"""
+        started = time.perf_counter()
+        loaded_at = datetime.utcnow()
+        rows = (await db.execute(
+            select(
+                UserVehicle.vehicle_id,
+                UserVehicle.id,
+                UserVehicle.ownership_start_date,
+                UserVehicle.ownership_end_date,
+            )
+            .filter(
+                UserVehicle.ownership_type == "renter",
+                UserVehicle.ownership_status == "active",
+                UserVehicle.is_deleted == False,
+                UserVehicle.ownership_end_date > loaded_at,
+            )
+            .order_by(UserVehicle.vehicle_id, UserVehicle.ownership_start_date)
+        )).all()
+
+        vehicles: Dict[str, VehicleIntervals] = {}
+        for vehicle_id, booking_id, start, end in rows:
+            intervals = vehicles.setdefault(vehicle_id, VehicleIntervals())
+            # Rows arrive sorted by start; skip any that would break the disjoint invariant
+            if intervals.ends and intervals.ends[-1] > start:
+                continue
+            intervals.starts.append(start)
+            intervals.ends.append(end)
+            intervals.booking_ids.append(booking_id)
+
+        with self._lock:
+            self._vehicles = vehicles
+        self.ready = True
+        self.loaded_at = loaded_at
+        self.last_load_rows = len(rows)
+        self.last_load_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "vehicles": len(self._vehicles),
+                "bookings": sum(len(intervals.starts) for intervals in self._vehicles.values()),
+                "fast_rejects": self.fast_rejects,
+                "stale_evictions": self.stale_evictions,
+                "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+                "last_load_rows": self.last_load_rows,
+                "last_load_ms": self.last_load_ms,
+            }
+
+
+booking_index = BookingIntervalIndex()
+
+
+async def load_booking_index() -> None:
+    """Build the booking index using its own session"""
+    async with AsyncSessionLocal() as db:
+        await booking_index.load(db)
@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import List, Optional
+import uuid
+
+from sqlalchemy import Numeric, Select, and_, case, select, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ...constants.permissions import Role, Status
+from ...core.db import unit_of_work
+from ...utils.serialization import rows_as_dicts
+from ..models.user_vehicle import UserVehicle
+from ..models.vehicle import Vehicle
+from ..vehicles.pricing import QuoteRules, compute_quotes, nan_to_none
+from ..vehicles.repository import RENTAL_PRICE_AS_FLOAT
+from .intervals import booking_index
+
+# Bookings are user_vehicles rows of this ownership type; cancelling one marks it inactive
+RENTER = "renter"
+
+# Columns labelled with BookingOut field names so rows serialize straight into the response schema
+BOOKING_COLUMNS = (
+    UserVehicle.id,
+    UserVehicle.vehicle_id,
+    UserVehicle.user_id,
+    UserVehicle.ownership_start_date.label("start_date"),
+    UserVehicle.ownership_end_date.label("end_date"),
+    case((UserVehicle.ownership_status == Status.ACTIVE, "active"), else_="cancelled").label("status"),
+    type_coerce(UserVehicle.total_price, Numeric(10, 2, asdecimal=False)).label("total_price"),
+)
+
+
+def _bookings() -> tuple:
+    return (UserVehicle.ownership_type == RENTER, UserVehicle.is_deleted == False)
+
+
+def _active_bookings() -> tuple:
+    return (*_bookings(), UserVehicle.ownership_status == Status.ACTIVE)
+
+
+async def is_booking_active(db: AsyncSession, booking_id: int) -> bool:
+    try:
+        result = await db.execute(select(UserVehicle.id).filter(UserVehicle.id == booking_id, *_active_bookings()))
+        return result.first() is not None
+    except Exception as e:
+        raise Exception(f"Failed to get booking: {str(e)}")
+
+
+async def create_booking(
+    db: AsyncSession,
+    renter_id: uuid.UUID,
+    vehicle_id: uuid.UUID,
+    start: datetime,
+    end: datetime,
+    rules: QuoteRules,
+) -> dict:
+    """
+    Book [start, end) on a vehicle. The vehicle row is locked first, so concurrent bookings
+    of the same vehicle run the overlap check and insert one at a time.
+    """
+    vehicle_id = str(vehicle_id)
+    try:
+        async with unit_of_work(db):
+            vehicle = (await db.execute(
+                select(Vehicle.id, Vehicle.rental_duration, RENTAL_PRICE_AS_FLOAT, Vehicle.availability_status)
+                .filter(Vehicle.id == vehicle_id, Vehicle.is_deleted == False)
+                .with_for_update()
+            )).first()
+            if vehicle is None:
+                raise Exception("Vehicle not found")
+            if vehicle.availability_status == "maintenance":
+                raise Exception("Vehicle is under maintenance")
+
+            # A locking read sees the latest committed bookings even if this session's
+            # snapshot was taken before the vehicle lock was granted
+            conflict = (await db.execute(
+                select(UserVehicle.id, UserVehicle.ownership_start_date, UserVehicle.ownership_end_date)
+                .filter(
+                    UserVehicle.vehicle_id == vehicle_id,
+                    *_active_bookings(),
+                    UserVehicle.ownership_start_date < end,
+                    UserVehicle.ownership_end_date > start,
+                )
+                .limit(1)
+                .with_for_update(read=True)
+            )).first()
+            if conflict is not None:
+                # Committed by another request or worker; teach the index so the next attempt fails fast
+                booking_index.add(vehicle_id, conflict.id, conflict.ownership_start_date, conflict.ownership_end_date)
+                raise Exception(f"Slot conflicts with booking {conflict.id}")
+
+            quote = compute_quotes(
+                int((end - start).total_seconds()), [vehicle.rental_duration], [vehicle.rental_price], rules
+            )
+            booking = UserVehicle(
+                user_id=str(renter_id),
+                vehicle_id=vehicle_id,
+                ownership_type=RENTER,
+                ownership_status=Status.ACTIVE,
+                ownership_start_date=start,
+                ownership_end_date=end,
+                total_price=nan_to_none(quote["price"])[0],
+                is_deleted=False,
+            )
+            db.add(booking)
+            await db.flush()
+
+        booking_index.add(vehicle_id, booking.id, start, end)
+        return {
+            "id": booking.id,
+            "vehicle_id": vehicle_id,
+            "user_id": booking.user_id,
+            "start_date": start,
+            "end_date": end,
+            "status": "active",
+            "total_price": booking.total_price,
+        }
+    except Exception as e:
+        raise Exception(f"Failed to create booking: {str(e)}")
+
+
+async def cancel_booking(db: AsyncSession, user_id: uuid.UUID, booking_id: int) -> dict:
+    """Cancel a booking that has not ended; allowed for its renter and the vehicle's owner"""
+    user_id = str(user_id)
+    owner_link = aliased(UserVehicle)
+    try:
+        async with unit_of_work(db):
+            # Lock the booking and learn whether the caller owns its vehicle in one round trip
+            row = (await db.execute(
+                select(*BOOKING_COLUMNS, owner_link.id.label("owner_link_id"))
+                .outerjoin(owner_link, and_(
+                    owner_link.vehicle_id == UserVehicle.vehicle_id,
+                    owner_link.user_id == user_id,
+                    owner_link.ownership_type == Role.OWNER,
+                    owner_link.ownership_status == Status.ACTIVE,
+                    owner_link.is_deleted == False,
+                ))
+                .filter(UserVehicle.id == booking_id, *_bookings())
+                .limit(1)
+                .with_for_update(of=UserVehicle)
+            )).first()
+            if row is None:
+                raise Exception("Booking not found")
+            booking = row._asdict()
+            if booking.pop("owner_link_id") is None and booking["user_id"] != user_id:
+                raise Exception("Not authorized to cancel this booking")
+            if booking["status"] != "active":
+                raise Exception("Booking is already cancelled")
+            now = datetime.utcnow()
+            if booking["end_date"] <= now:
+                raise Exception("Booking has already ended")
+
+            await db.execute(
+                update(UserVehicle)
+                .where(UserVehicle.id == booking_id)
+                .values(
+                    ownership_status=Status.INACTIVE,
+                    additional_data={"cancelled_by": user_id, "cancelled_at": now.isoformat()},
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        booking_index.remove(booking["vehicle_id"], booking_id)
+        booking["status"] = "cancelled"
+        return booking
+    except Exception as e:
+        raise Exception(f"Failed to cancel booking: {str(e)}")
+
+
+def build_bookings_query(
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None,
+    booking_status: Optional[str] = None,
+) -> Select:
+    """Booking list query, newest first with keyset pagination on id; callers add the owner filter"""
+    query = select(*BOOKING_COLUMNS).filter(*_bookings())
+    if booking_status is not None:
+        query = query.filter(
+            UserVehicle.ownership_status == Status.ACTIVE
+            if booking_status == "active"
+            else UserVehicle.ownership_status != Status.ACTIVE
+        )
+    if before_id is not None:
+        query = query.filter(UserVehicle.id < before_id)
+    query = query.order_by(UserVehicle.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+async def list_user_bookings(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None,
+    booking_status: Optional[str] = None,
+) -> List[dict]:
+    try:
+        query = build_bookings_query(limit, before_id, booking_status).filter(UserVehicle.user_id == str(user_id))
+        return rows_as_dicts(await db.execute(query))
+    except Exception as e:
+        raise Exception(f"Failed to get bookings: {str(e)}")
+
+
+async def list_vehicle_bookings(
+    db: AsyncSession,
+    vehicle_id: uuid.UUID,
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None,
+    booking_status: Optional[str] = None,
+) -> List[dict]:
+    try:
+        query = build_bookings_query(limit, before_id, booking_status).filter(UserVehicle.vehicle_id == str(vehicle_id))
+        return rows_as_dicts(await db.execute(query))
+    except Exception as e:
+        raise Exception(f"Failed to get vehicle bookings: {str(e)}")
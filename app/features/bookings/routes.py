@@ -0,0 +1,113 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, status, Request, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from ...core.db import get_async_db_session
+from ...constants.permissions import Permission, Role, require_permission_dependency, require_role_dependency
+from ...utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ...utils.serialization import adapter_response
+from .schemas import BookingCreate, BookingOut, BOOKING_ROWS
+from .controller import (
+    create_new_booking,
+    cancel_existing_booking,
+    get_user_bookings,
+    get_vehicle_bookings,
+)
+
+router = APIRouter(prefix="/api/v1/bookings", tags=["bookings"])
+
+
+@router.post(
+    "/create-booking",
+    response_model=BookingOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission_dependency(Permission.BOOKING_CREATE))],
+)
+async def create_booking(
+    Request: Request,
+    payload: BookingCreate,
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """Book a vehicle for [start, end); 409 if the slot overlaps an active booking"""
+    try:
+        return await create_new_booking(db, Request.state.user_id, payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/cancel-booking/{booking_id}",
+    response_model=BookingOut,
+    dependencies=[Depends(require_permission_dependency(Permission.BOOKING_UPDATE))],
+)
+async def cancel_booking(
+    Request: Request,
+    booking_id: int,
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """Cancel a booking that has not ended (its renter or the vehicle's owner)"""
+    try:
+        return await cancel_existing_booking(db, Request.state.user_id, booking_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/get-my-bookings",
+    response_model=list[BookingOut],
+    dependencies=[Depends(require_permission_dependency(Permission.BOOKING_READ))],
+)
+async def my_bookings(
+    Request: Request,
+    booking_status: Optional[str] = Query(None, alias="status", pattern="^(active|cancelled)$"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """List the caller's bookings, newest first"""
+    try:
+        bookings, next_cursor = await get_user_bookings(db, Request.state.user_id, limit, cursor, booking_status)
+        result = adapter_response(BOOKING_ROWS, bookings)
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/get-vehicle-bookings/{vehicle_id}",
+    response_model=list[BookingOut],
+    dependencies=[
+        Depends(require_role_dependency(Role.OWNER, Role.ADMIN)),
+        Depends(require_permission_dependency(Permission.BOOKING_READ)),
+    ],
+)
+async def vehicle_bookings(
+    Request: Request,
+    vehicle_id: uuid.UUID,
+    booking_status: Optional[str] = Query(None, alias="status", pattern="^(active|cancelled)$"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """List bookings of a vehicle the caller owns, newest first"""
+    try:
+        bookings, next_cursor = await get_vehicle_bookings(
+            db, Request.state.user_id, vehicle_id, limit, cursor, booking_status
+        )
+        result = adapter_response(BOOKING_ROWS, bookings)
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import List, Optional
+from typing_extensions import TypedDict
+from pydantic import BaseModel, Field, TypeAdapter
+import uuid
+
+
+class BookingCreate(BaseModel):
+    vehicle_id: uuid.UUID = Field(..., description="Vehicle to book")
+    start: datetime = Field(..., description="Booking start (naive values are treated as UTC)")
+    end: datetime = Field(..., description="Booking end, exclusive (naive values are treated as UTC)")
+
+
+class BookingOut(BaseModel):
+    id: int
+    vehicle_id: str
+    user_id: str
+    start_date: datetime
+    end_date: datetime
+    status: str = Field(description="active or cancelled")
+    total_price: Optional[float] = Field(default=None, description="Quoted price at booking time")
+
+
+class BookingRow(TypedDict):
+    """BookingOut as selected by the booking queries; serialized without re-validation"""
+    id: int
+    vehicle_id: str
+    user_id: str
+    start_date: datetime
+    end_date: datetime
+    status: str
+    total_price: Optional[float]
+
+
+# Built once at import; encodes booking rows straight to JSON bytes
+BOOKING_ROWS = TypeAdapter(List[BookingRow])
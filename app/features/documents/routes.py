@@ -1,29 +1,36 @@
-from fastapi import APIRouter, Depends, status, Request, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, status, Request, Response, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from ...core.db import get_db_session
-from ...constants.permissions import Role
-from ...utils.helpers import is_user_type_in_allowed_roles
-from .service import get_documents_for_entity
+from ...core.db import get_async_db_session
+from ...constants.permissions import Role, require_role_dependency
+from ...utils.etag import make_etag, etag_matches, not_modified_response, set_etag_headers
+from .service import get_documents_for_entity, get_documents_version
 from .schemas import DocumentOut
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
 
 
-@router.get("/vehicle/{vehicle_id}", response_model=list[DocumentOut])
+@router.get(
+    "/vehicle/{vehicle_id}",
+    response_model=list[DocumentOut],
+    dependencies=[Depends(require_role_dependency(Role.OWNER, Role.ADMIN))],
+)
 async def get_vehicle_documents(
     vehicle_id: uuid.UUID,
     request: Request,
-    db: Session = Depends(get_db_session),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """Get all documents for a specific vehicle"""
-    try:     
-        # Check if user has required role (Owner or Admin)
-        if not is_user_type_in_allowed_roles(request.state.user_type, [Role.OWNER, Role.ADMIN]):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-        
+    try:
+        version = await get_documents_version(db, "vehicle", vehicle_id)
+        etag = make_etag("vehicle-documents", str(vehicle_id), *version)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
         documents = await get_documents_for_entity(db, "vehicle", vehicle_id)
+        set_etag_headers(response, etag)
         return [DocumentOut.model_validate(doc) for doc in documents]
     except HTTPException:
         raise
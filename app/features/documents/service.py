@@ -1,125 +1,109 @@
-import base64
-import os
+import asyncio
 import uuid
 from datetime import datetime
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
 from ..models.document import Document
 from ..models.media_document import MediaDocument
-from ..models.media_document_url import MediaDocumentUrl
 from .schemas import DocumentData
+from .storage import DocumentContent, claim_contents, hash_base64_content, release_contents
+from ..vehicles.schemas import DocumentMetadata
 
 
-# Module-level config for uploads directory
-UPLOAD_DIR = "uploads/documents"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-
-async def save_base64_image(base64_string: str, document_type: str, document_number: str) -> str:
+async def hash_base64_contents(documents_data: List[DocumentData]) -> List[DocumentContent]:
     """
-    Save base64 image to file system and return file path
+    Hash the images of several documents concurrently on the document write pool; nothing is
+    written until the contents are claimed, and then only images not already stored
     """
-    try:
-        if ',' in base64_string:
-            base64_string = base64_string.split(',')[1]
+    return list(await asyncio.gather(
+        *(hash_base64_content(doc_data.document_image) for doc_data in documents_data)
+    ))
 
-        image_data = base64.b64decode(base64_string)
 
-        file_extension = "jpg"
-        filename = f"{document_type}_{document_number}_{uuid.uuid4().hex}.{file_extension}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
-
-        with open(file_path, 'wb') as f:
-            f.write(image_data)
-
-        return file_path
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to save image: {str(e)}"
-        )
+async def add_documents_batch(
+    db: AsyncSession,
+    documents: List[Tuple[DocumentMetadata, DocumentContent]],
+    entity_type: str,
+    entity_id: uuid.UUID,
+    added_by: str
+) -> List[int]:
+    """
+    Add document and link rows for (metadata, content) pairs, one multi-row INSERT per table
+    whatever the number of documents; each content is stored once however many documents share
+    it. Returns the new document ids in input order.
+    """
+    if not documents:
+        return []
+    entity_id = str(entity_id)
+    now = datetime.utcnow()
+    url_ids = await claim_contents(db, [content for _, content in documents], added_by)
+
+    await db.execute(insert(Document), [
+        {"type": metadata.document_type, "entity_type": entity_type, "entity_id": entity_id,
+         "document_number": metadata.document_number, "expiry_date": metadata.expiry_date,
+         "issue_date": metadata.issue_date, "verification_status": "pending", "is_deleted": False,
+         "added_date": now, "added_by": added_by}
+        for metadata, _ in documents
+    ])
+    # Ids grow within one INSERT and writers of an entity are serialized by its caller (new vehicle
+    # or locked vehicle row), so the entity's newest active documents are exactly this batch, in order
+    document_ids = (await db.execute(
+        select(Document.id)
+        .filter(Document.entity_type == entity_type, Document.entity_id == entity_id, Document.is_deleted == False)
+        .order_by(Document.id.desc())
+        .limit(len(documents))
+    )).scalars().all()[::-1]
+
+    await db.execute(insert(MediaDocument), [
+        {"documents_id": document_id, "media_documents_urls_id": url_id,
+         "is_deleted": False, "added_by": added_by}
+        for document_id, url_id in zip(document_ids, url_ids)
+    ])
+    return document_ids
 
 
-async def create_document_with_media(
-    db: Session,
-    document_data: DocumentData,
+async def create_multiple_documents(
+    db: AsyncSession,
+    documents_data: List[DocumentData],
     entity_type: str,
     entity_id: uuid.UUID,
     added_by: str
-) -> Document:
+) -> List[int]:
     """
-    Create a document with its associated media
+    Create multiple documents for an entity: images are hashed concurrently off the event loop and
+    only ones not already stored are written, then all rows are inserted in one batch (flushes
+    only; the caller's unit of work commits)
     """
+    contents = await hash_base64_contents(documents_data)
     try:
-        file_path = await save_base64_image(
-            document_data.document_image,
-            document_data.document_type,
-            document_data.document_number
-        )
-
-        media_url = MediaDocumentUrl(
-            type='image',
-            url=file_path,
-            encoding='base64',
-            added_by=added_by
+        return await add_documents_batch(
+            db, list(zip(documents_data, contents)), entity_type, entity_id, added_by
         )
-        db.add(media_url)
-        db.flush()
-
-        document = Document(
-            type=document_data.document_type,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            document_number=document_data.document_number,
-            expiry_date=document_data.expiry_date,
-            issue_date=document_data.issue_date,
-            verification_status='pending',
-            added_by=added_by
-        )
-        db.add(document)
-        db.flush()
-
-        media_document = MediaDocument(
-            documents_id=document.id,
-            media_documents_urls_id=media_url.id,
-            added_by=added_by
-        )
-        db.add(media_document)
-        db.flush()
-
-        return document
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create document: {str(e)}"
+            detail=f"Failed to create documents: {str(e)}"
         )
 
 
-async def create_multiple_documents(
-    db: Session,
-    documents_data: List[DocumentData],
+async def create_documents_from_files(
+    db: AsyncSession,
+    documents: List[Tuple[DocumentMetadata, DocumentContent]],
     entity_type: str,
     entity_id: uuid.UUID,
     added_by: str
-) -> List[Document]:
+) -> List[int]:
     """
-    Create multiple documents for an entity
+    Create documents for files already streamed to disk, given (metadata, content) pairs
+    (flushes only; the caller's unit of work commits)
     """
     try:
-        created_documents = []
-        for doc_data in documents_data:
-            document = await create_document_with_media(
-                db, doc_data, entity_type, entity_id, added_by
-            )
-            created_documents.append(document)
-
-        db.commit()
-        return created_documents
+        return await add_documents_batch(db, documents, entity_type, entity_id, added_by)
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create documents: {str(e)}"
@@ -127,30 +111,41 @@ async def create_multiple_documents(
 
 
 async def update_documents_for_entity(
-    db: Session,
+    db: AsyncSession,
     entity_type: str,
     entity_id: uuid.UUID,
     documents_data: List[DocumentData],
     modified_by: str
-) -> List[Document]:
+) -> List[int]:
     """
-    Update documents for an entity (soft delete existing and create new ones)
+    Update documents for an entity (soft delete existing and create new ones). Images that
+    are re-sent unchanged keep their stored file: the old links release it and the new ones
+    claim it again in the same transaction.
     """
     try:
-        existing_docs = db.query(Document).filter(
-            Document.entity_type == entity_type,
-            Document.entity_id == entity_id,
-            Document.is_deleted == False
-        ).all()
+        result = await db.execute(
+            select(Document)
+            .options(selectinload(Document.media_documents))
+            .filter(
+                Document.entity_type == entity_type,
+                Document.entity_id == str(entity_id),
+                Document.is_deleted == False
+            )
+        )
+        existing_docs = result.scalars().all()
 
+        released_url_ids = []
         for doc in existing_docs:
             doc.is_deleted = True
             doc.modified_date = datetime.utcnow()
             doc.modified_by = modified_by
 
             for media_doc in doc.media_documents:
+                if not media_doc.is_deleted:
+                    released_url_ids.append(media_doc.media_documents_urls_id)
                 media_doc.is_deleted = True
                 media_doc.modified_by = modified_by
+        await release_contents(db, released_url_ids)
 
         new_documents = await create_multiple_documents(
             db, documents_data, entity_type, entity_id, modified_by
@@ -158,7 +153,6 @@ async def update_documents_for_entity(
 
         return new_documents
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update documents: {str(e)}"
@@ -166,7 +160,7 @@ async def update_documents_for_entity(
 
 
 async def get_documents_for_entity(
-    db: Session,
+    db: AsyncSession,
     entity_type: str,
     entity_id: uuid.UUID
 ) -> List[Document]:
@@ -174,13 +168,41 @@ async def get_documents_for_entity(
     Get all active documents for an entity
     """
     try:
-        return db.query(Document).filter(
-            Document.entity_type == entity_type,
-            Document.entity_id == entity_id,
-            Document.is_deleted == False
-        ).all()
+        result = await db.execute(
+            select(Document).filter(
+                Document.entity_type == entity_type,
+                Document.entity_id == str(entity_id),
+                Document.is_deleted == False
+            )
+        )
+        return list(result.scalars().all())
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get documents: {str(e)}"
         )
+
+
+async def get_documents_version(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: uuid.UUID
+) -> Tuple[int, int, Optional[datetime]]:
+    """
+    Cheap fingerprint of an entity's active documents: (count, newest id, last modification).
+    Documents are only ever inserted or soft-deleted, so any change moves the count or newest id.
+    """
+    try:
+        count, last_id, last_modified = (await db.execute(
+            select(func.count(Document.id), func.max(Document.id), func.max(Document.modified_date)).filter(
+                Document.entity_type == entity_type,
+                Document.entity_id == str(entity_id),
+                Document.is_deleted == False
+            )
+        )).one()
+        return count, last_id or 0, last_modified
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get documents version: {str(e)}"
+        )
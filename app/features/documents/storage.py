@@ -0,0 +1,337 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import os
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from ...core.config import get_settings
+from ...core.db import AsyncSessionLocal, on_rollback, unit_of_work
+from ...core.executor import MeteredExecutor
+
+from ..models.media_document_url import MediaDocumentUrl
+
+
+# Module-level config for uploads directory. Stored files live two directory levels down
+# (256 x 256 shards) so no directory grows large; only in-flight temporary files sit at the top
+UPLOAD_DIR = "uploads/documents"
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# Decoding, hashing and disk writes run here, off the event loop; the pool size bounds concurrent writes
+document_write_executor = MeteredExecutor("document-write", get_settings().document_write_workers)
+
+# Base64 characters decoded per step; a multiple of 4 so every window holds whole quanta
+BASE64_WINDOW_CHARS = 64 * 1024
+BASE64_WHITESPACE = str.maketrans("", "", " \t\r\n")
+
+# Unreferenced files removed per collector transaction
+COLLECT_BATCH_SIZE = 500
+
+
+def iter_base64_chunks(base64_string: str, max_bytes: int) -> Iterator[bytes]:
+    """
+    Decode base64 (optionally a data URL) one window at a time, yielding the decoded bytes.
+
+    Only one window of text and its decoded bytes are held at once, so memory stays
+    constant however large the image is. Whitespace (MIME line breaks) is ignored.
+
+    Raises:
+        ValueError: If the payload is not valid base64 or decodes to more than max_bytes
+    """
+    # Skip a data URL prefix without copying the payload
+    start = base64_string.find(',', 0, 256) + 1
+    decoded = 0
+    carry = ""
+    for offset in range(start, len(base64_string), BASE64_WINDOW_CHARS):
+        window = carry + base64_string[offset:offset + BASE64_WINDOW_CHARS].translate(BASE64_WHITESPACE)
+        # Hold back a partial quantum until the next window completes it
+        cut = len(window) - len(window) % 4
+        carry = window[cut:]
+        try:
+            chunk = base64.b64decode(window[:cut], validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 data: {str(e)}")
+        decoded += len(chunk)
+        if decoded > max_bytes:
+            raise ValueError(f"Image exceeds {max_bytes} bytes")
+        yield chunk
+    if carry:
+        raise ValueError("Invalid base64 data: truncated input")
+
+
+def decode_base64_to_file(base64_string: str, file_path: str, max_bytes: int) -> int:
+    """
+    Decode base64 (optionally a data URL) into a file one window at a time.
+
+    Args:
+        base64_string (str): Base64 payload, with or without a "data:...;base64," prefix
+        file_path (str): File to create
+        max_bytes (int): Largest decoded size accepted
+
+    Returns:
+        int: Decoded size in bytes
+
+    Raises:
+        ValueError: If the payload is not valid base64 or decodes to more than max_bytes
+    """
+    written = 0
+    with open(file_path, 'wb') as f:
+        for chunk in iter_base64_chunks(base64_string, max_bytes):
+            written += len(chunk)
+            f.write(chunk)
+    return written
+
+
+def hash_base64(base64_string: str, max_bytes: int) -> Tuple[str, int]:
+    """SHA-256 hex digest and decoded size of a base64 payload, without writing anything"""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter_base64_chunks(base64_string, max_bytes):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def remove_files(file_paths: List[str]) -> None:
+    """Remove stored files, ignoring ones that are already gone"""
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+def _sharded(prefix: str, file_name: str) -> str:
+    return os.path.join(UPLOAD_DIR, prefix[:2], prefix[2:4], file_name)
+
+
+def content_path(content_hash: str, extension: str) -> str:
+    """Path a file is stored under: named and sharded by its content, so identical files share one path"""
+    return _sharded(content_hash, f"{content_hash}.{extension}")
+
+
+def shard_path(file_name: str) -> str:
+    """Sharded path for a file stored before content addressing, by the SHA-256 of its name"""
+    return _sharded(hashlib.sha256(file_name.encode()).hexdigest(), file_name)
+
+
+def move_to_shard(source_path: str, target_path: str) -> str:
+    """
+    Move a stored file into its shard (blocking). Returns "moved", "already" if only the target
+    exists (an earlier run moved it), or "missing" if neither does.
+    """
+    if os.path.exists(source_path):
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        os.replace(source_path, target_path)
+        return "moved"
+    return "already" if os.path.exists(target_path) else "missing"
+
+
+class DocumentContent:
+    """
+    Bytes of one document image, identified by their SHA-256 but not yet at their stored path.
+    The bytes come either from a base64 payload (decoded only if they must be written) or from
+    a temporary file an upload was streamed to (moved into place, or removed if not needed).
+    """
+
+    __slots__ = ("content_hash", "extension", "size", "encoding", "base64_string", "temp_path")
+
+    def __init__(
+        self,
+        content_hash: str,
+        extension: str,
+        size: int,
+        encoding: str,
+        base64_string: Optional[str] = None,
+        temp_path: Optional[str] = None,
+    ):
+        self.content_hash = content_hash
+        self.extension = extension
+        self.size = size
+        self.encoding = encoding
+        self.base64_string = base64_string
+        self.temp_path = temp_path
+
+    def place(self, file_path: str) -> None:
+        """Make sure file_path holds these bytes, writing them only if it is missing (blocking)"""
+        if os.path.exists(file_path):
+            self.discard()
+            return
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if self.temp_path is not None:
+            os.replace(self.temp_path, file_path)
+            self.temp_path = None
+            return
+        # Decode next to the target and rename, so a reader never sees a partly written file
+        partial_path = f"{file_path}.{uuid.uuid4().hex}.part"
+        try:
+            decode_base64_to_file(self.base64_string, partial_path, get_settings().document_upload_max_bytes)
+            os.replace(partial_path, file_path)
+        except BaseException:
+            remove_files([partial_path])
+            raise
+
+    def discard(self) -> None:
+        """Remove the temporary file, if any (blocking)"""
+        if self.temp_path is not None:
+            remove_files([self.temp_path])
+            self.temp_path = None
+
+
+async def hash_base64_content(base64_string: str) -> DocumentContent:
+    """Hash a base64 image on the document write pool; nothing is written yet"""
+    try:
+        content_hash, size = await document_write_executor.run(
+            hash_base64, base64_string, get_settings().document_upload_max_bytes
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to save image: {str(e)}"
+        )
+    return DocumentContent(content_hash, "jpg", size, 'base64', base64_string=base64_string)
+
+
+async def _lock_content_rows(db: AsyncSession, content_hashes: List[str]) -> Dict[str, Tuple[int, str]]:
+    # Locking read: sees the latest committed rows, and holds them against the collector until commit
+    result = await db.execute(
+        select(MediaDocumentUrl.content_hash, MediaDocumentUrl.id, MediaDocumentUrl.url)
+        .filter(MediaDocumentUrl.content_hash.in_(content_hashes))
+        .order_by(MediaDocumentUrl.content_hash)
+        .with_for_update()
+    )
+    return {content_hash: (url_id, url) for content_hash, url_id, url in result.all()}
+
+
+def _is_duplicate_content_hash(error: IntegrityError) -> bool:
+    # MySQL names the unique index ("Duplicate entry ... for key '...content_hash'"),
+    # SQLite the column ("UNIQUE constraint failed: media_documents_urls.content_hash")
+    message = str(error.orig)
+    return ("Duplicate entry" in message or "UNIQUE constraint failed" in message) and "content_hash" in message
+
+
+async def _add_references(db: AsyncSession, references: Counter) -> None:
+    # One UPDATE whatever the number of rows: ref_count += references[id]; rows stored before
+    # content addressing have no hash and are not counted
+    await db.execute(
+        update(MediaDocumentUrl)
+        .where(MediaDocumentUrl.id.in_(list(references)), MediaDocumentUrl.content_hash.isnot(None))
+        .values(ref_count=MediaDocumentUrl.ref_count + case(dict(references), value=MediaDocumentUrl.id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def claim_contents(db: AsyncSession, contents: List[DocumentContent], added_by: str) -> List[int]:
+    """
+    Take one reference per content on the media url row holding its hash and return the row ids
+    in input order. Identical contents share one row and one file: a file is only written when
+    no row had its hash yet (or its file has gone missing). Rows stay locked until commit.
+    """
+    if not contents:
+        return []
+    firsts: Dict[str, DocumentContent] = {}
+    for content in contents:
+        firsts.setdefault(content.content_hash, content)
+
+    rows = await _lock_content_rows(db, sorted(firsts))
+    missing = sorted(set(firsts) - set(rows))
+    inserted: List[str] = []
+    # One retry is enough: after the re-lock every row a concurrent upload inserted is visible
+    for attempt in range(2):
+        if not missing:
+            break
+        now = datetime.utcnow()
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(MediaDocumentUrl), [
+                    {"type": "image", "url": content_path(content_hash, firsts[content_hash].extension),
+                     "encoding": firsts[content_hash].encoding, "content_hash": content_hash, "ref_count": 0,
+                     "is_deleted": False, "added_date": now, "added_by": added_by}
+                    for content_hash in missing
+                ])
+            inserted.extend(missing)
+        except IntegrityError as e:
+            # Only a concurrent upload of the same content is resolved by re-locking; anything else
+            # (NOT NULL, a too long url, ...) would fail the same way again
+            if attempt or not _is_duplicate_content_hash(e):
+                raise
+        rows.update(await _lock_content_rows(db, missing))
+        missing = [content_hash for content_hash in missing if content_hash not in rows]
+
+    await _add_references(db, Counter(rows[content.content_hash][0] for content in contents))
+
+    if inserted:
+        # Files of rows this transaction created would have no row after a rollback, and the
+        # collector only finds files through rows. They are removed before the rollback releases
+        # the rows' unique keys, so a concurrent upload of the same content never adopts them
+        new_paths = [rows[content_hash][1] for content_hash in inserted]
+        on_rollback(db, lambda: document_write_executor.run(remove_files, new_paths))
+
+    # The rows are locked, so the collector cannot remove these files while they are placed
+    placed = await asyncio.gather(
+        *(document_write_executor.run(content.place, rows[content_hash][1]) for content_hash, content in firsts.items()),
+        return_exceptions=True,
+    )
+    for content in contents:
+        if firsts[content.content_hash] is not content:
+            await document_write_executor.run(content.discard)
+    errors = [result for result in placed if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    return [rows[content.content_hash][0] for content in contents]
+
+
+async def release_contents(db: AsyncSession, url_ids: List[int]) -> None:
+    """
+    Drop one reference per id. Files are not removed here: rows left without references are
+    collected later by collect_unreferenced_files, after this transaction has committed.
+    """
+    if url_ids:
+        await _add_references(db, Counter({url_id: -count for url_id, count in Counter(url_ids).items()}))
+
+
+async def collect_unreferenced_files(db: AsyncSession, limit: int = COLLECT_BATCH_SIZE) -> int:
+    """
+    Remove the files of content rows no live document references any more and retire the rows
+    (their hash is cleared, so the same content uploaded later is stored afresh). Returns the count.
+    """
+    async with unit_of_work(db):
+        # Rows being claimed are locked by their uploader; skip them rather than wait
+        rows = (await db.execute(
+            select(MediaDocumentUrl.id, MediaDocumentUrl.url)
+            .filter(MediaDocumentUrl.content_hash.isnot(None), MediaDocumentUrl.ref_count <= 0)
+            .order_by(MediaDocumentUrl.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )).all()
+        if not rows:
+            return 0
+        # Files go while the rows are still locked: if the commit then fails, a later claim of the
+        # same hash finds the file missing and writes it again
+        await document_write_executor.run(remove_files, [url for _, url in rows])
+        await db.execute(
+            update(MediaDocumentUrl)
+            .where(MediaDocumentUrl.id.in_([url_id for url_id, _ in rows]))
+            .values(content_hash=None, is_deleted=True, modified_date=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    return len(rows)
+
+
+async def run_document_collector(interval_seconds: float) -> None:
+    """Background loop that removes document files no longer referenced"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                while await collect_unreferenced_files(db) == COLLECT_BATCH_SIZE:
+                    pass
+        except Exception as e:
+            print(f"Error collecting document files: {str(e)}")
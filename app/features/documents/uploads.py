@@ -0,0 +1,203 @@
+import hashlib
+import os
+import uuid
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+
+from .storage import UPLOAD_DIR, DocumentContent, document_write_executor, remove_files
+
+# Text fields are held in memory, so they get a small cap of their own
+MAX_FIELD_BYTES = 64 * 1024
+MAX_FILES = 20
+MAX_FIELDS = 50
+
+# Accepted image types and the extension they are stored under
+IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+
+class StoredFile:
+    """A file part of a multipart upload, already written to a temporary file in UPLOAD_DIR"""
+
+    __slots__ = ("field_name", "filename", "content_type", "path", "size", "digest")
+
+    def __init__(self, field_name: str, filename: str, content_type: str, path: str):
+        self.field_name = field_name
+        self.filename = filename
+        self.content_type = content_type
+        self.path = path
+        self.size = 0
+        # SHA-256 of the bytes, fed as they are written
+        self.digest = hashlib.sha256()
+
+    def content(self) -> DocumentContent:
+        """The stored bytes, to be moved to their content-addressed path when claimed"""
+        return DocumentContent(
+            self.digest.hexdigest(), IMAGE_EXTENSIONS[self.content_type], self.size, 'binary', temp_path=self.path
+        )
+
+
+class MultipartUpload:
+    """
+    Streaming multipart/form-data reader.
+
+    Each file part is written to its own file in UPLOAD_DIR chunk by chunk as the body
+    arrives, so memory per upload stays at one network chunk however large the files are.
+    Text fields are collected in `fields`, stored files in `files` in body order.
+    Call discard() to remove the stored files if the upload is not used.
+    """
+
+    def __init__(self, content_type: Optional[str], max_file_bytes: int):
+        disposition, params = parse_options_header(content_type or "")
+        if disposition != b"multipart/form-data" or b"boundary" not in params:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Content-Type must be multipart/form-data with a boundary",
+            )
+        self.max_file_bytes = max_file_bytes
+        self.fields: Dict[str, List[str]] = {}
+        self.files: List[StoredFile] = []
+        self._boundary = params[b"boundary"]
+        self._header_name = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._field_name: Optional[str] = None
+        self._field_data = bytearray()
+        self._field_count = 0
+        self._file: Optional[StoredFile] = None
+        self._handle: Optional[BinaryIO] = None
+        self._file_written: Optional[StoredFile] = None
+        # Parser callbacks are synchronous; file data is queued here and written between chunks
+        self._pending: List[Optional[bytes]] = []
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._field_name = None
+        self._field_data = bytearray()
+        self._file = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if b"name" not in options:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Multipart part without a name")
+        self._field_name = options[b"name"].decode("utf-8", errors="replace")
+        if b"filename" not in options:
+            self._field_count += 1
+            if self._field_count > MAX_FIELDS:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many fields (max {MAX_FIELDS})")
+            return
+
+        if len(self.files) >= MAX_FILES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many files (max {MAX_FILES})")
+        content_type = self._headers.get(b"content-type", b"").decode("latin-1").split(";")[0].strip().lower()
+        extension = IMAGE_EXTENSIONS.get(content_type)
+        if extension is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported file type: {content_type or 'missing Content-Type'}",
+            )
+        self._file = StoredFile(
+            field_name=self._field_name,
+            filename=options[b"filename"].decode("utf-8", errors="replace"),
+            content_type=content_type,
+            path=os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}.{extension}"),
+        )
+        self.files.append(self._file)
+        self._pending.append(None)  # marks "open a new file" in the write queue
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._file is None:
+            if len(self._field_data) + (end - start) > MAX_FIELD_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Field {self._field_name} exceeds {MAX_FIELD_BYTES} bytes",
+                )
+            self._field_data += data[start:end]
+            return
+        self._file.size += end - start
+        if self._file.size > self.max_file_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File {self._file.filename} exceeds {self.max_file_bytes} bytes",
+            )
+        self._pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._file is None and self._field_name is not None:
+            self.fields.setdefault(self._field_name, []).append(self._field_data.decode("utf-8", errors="replace"))
+
+    def _open_next(self, position: int) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._file_written = self.files[position]
+        self._handle = open(self._file_written.path, "wb")
+
+    def _write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self._file_written.digest.update(data)
+
+    async def _flush_pending(self, opened: int) -> int:
+        for data in self._pending:
+            if data is None:
+                await document_write_executor.run(self._open_next, opened)
+                opened += 1
+            else:
+                await document_write_executor.run(self._write, data)
+        self._pending.clear()
+        return opened
+
+    async def parse(self, chunks: AsyncIterator[bytes]) -> "MultipartUpload":
+        """Consume the body, storing file parts as they stream in; stored files are removed on error"""
+        parser = MultipartParser(self._boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+        opened = 0
+        try:
+            async for chunk in chunks:
+                parser.write(chunk)
+                opened = await self._flush_pending(opened)
+            parser.finalize()
+            await self._flush_pending(opened)
+        except MultipartParseError as e:
+            self.discard()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Malformed multipart body: {str(e)}")
+        except BaseException:
+            self.discard()
+            raise
+        finally:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        return self
+
+    def field(self, name: str) -> Optional[str]:
+        """Last value of a text field, or None if it was not sent"""
+        values = self.fields.get(name)
+        return values[-1] if values else None
+
+    def discard(self) -> None:
+        """Remove every stored file of this upload"""
+        remove_files([stored.path for stored in self.files])
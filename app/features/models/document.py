@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, DateTime, Enum, JSON, Integer, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, Enum, JSON, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -9,6 +9,9 @@ from ...core.db import Base
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_entity", "entity_type", "entity_id", "is_deleted"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, JSON, Enum, DateTime
+from sqlalchemy import String, Boolean, JSON, Enum, DateTime, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ...core.db import Base
@@ -14,6 +14,11 @@ class MediaDocumentUrl(Base):
     url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     file_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     encoding: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # SHA-256 hex of the file; rows sharing a file share one row. Null for files stored before
+    # content addressing and for rows whose file has been collected
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, unique=True, index=True)
+    # Live media document links to this row; the collector removes the file once it drops to 0
+    ref_count: Mapped[int] = mapped_column(Integer, default=0, server_default='0', nullable=False, index=True)
     additional_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
     added_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime, Enum, JSON
+from sqlalchemy import String, Boolean, DateTime, Enum, JSON, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -20,8 +20,9 @@ class User(Base):
     status: Mapped[str] = mapped_column(Enum('active', 'inactive', 'pending', name='user_status'), default='active')
     additional_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
+    token_version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     added_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    modified_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=datetime.utcnow)
+    modified_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=datetime.utcnow, index=True)
     added_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     modified_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
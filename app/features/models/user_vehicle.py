@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, DateTime, Enum, Numeric, JSON, ForeignKey, Integer
+from sqlalchemy import String, Boolean, DateTime, Enum, Numeric, JSON, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -9,6 +9,9 @@ from ...core.db import Base
 
 class UserVehicle(Base):
     __tablename__ = "user_vehicles"
+    __table_args__ = (
+        Index("ix_user_vehicles_booking", "vehicle_id", "ownership_type", "ownership_status", "ownership_start_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
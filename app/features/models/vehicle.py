@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime, Enum, Numeric, JSON
+from sqlalchemy import String, Boolean, DateTime, Enum, Numeric, JSON, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -9,6 +9,19 @@ from ...core.db import Base
 
 class Vehicle(Base):
     __tablename__ = "vehicles"
+    __table_args__ = (
+        # Search indexes, one per combination of the equality filters (availability_status, type,
+        # rental_duration): those columns first, then rental_price for the price range and result
+        # ordering (InnoDB appends the primary key, completing the (price, id) keyset)
+        Index("ix_vehicles_search_status_type_duration", "is_deleted", "availability_status", "type", "rental_duration", "rental_price"),
+        Index("ix_vehicles_search_status_type", "is_deleted", "availability_status", "type", "rental_price"),
+        Index("ix_vehicles_search_status_duration", "is_deleted", "availability_status", "rental_duration", "rental_price"),
+        Index("ix_vehicles_search_status", "is_deleted", "availability_status", "rental_price"),
+        Index("ix_vehicles_search_type_duration", "is_deleted", "type", "rental_duration", "rental_price"),
+        Index("ix_vehicles_search_type", "is_deleted", "type", "rental_price"),
+        Index("ix_vehicles_search_duration", "is_deleted", "rental_duration", "rental_price"),
+        Index("ix_vehicles_search_price", "is_deleted", "rental_price"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -19,10 +32,14 @@ class Vehicle(Base):
     rental_price: Mapped[Optional[float]] = mapped_column(Numeric(10, 2), nullable=True)
     additional_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
-    added_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    modified_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=datetime.utcnow)
+    added_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    modified_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=datetime.utcnow, index=True)
     added_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     modified_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    # Bumped on every write (by the ORM, and explicitly in bulk UPDATEs); used for ETags
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     # Relationships
     user_vehicles: Mapped[List["UserVehicle"]] = relationship("UserVehicle", back_populates="vehicle")
+
+    __mapper_args__ = {"version_id_col": version}
@@ -1,14 +1,14 @@
 from typing import Dict, Any, List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status, Depends
 
-from ...core.db import get_db_session
+from ...core.db import get_async_db_session
 from .service import get_settings_by_keys, get_all_settings
 
 
 async def get_settings_by_keys_controller(
     keys: List[str],
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ) -> List[Dict[str, Any]]:
     """
     Get multiple settings by keys - returns only key and value
@@ -35,7 +35,7 @@ async def get_settings_by_keys_controller(
 
 
 async def get_all_settings_controller(
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ) -> List[Dict[str, Any]]:
     """
     Get all settings - returns only key and value
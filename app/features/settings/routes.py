@@ -1,22 +1,27 @@
 from typing import Dict, Any, List
-from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .controller import (
     get_settings_by_keys_controller,
     get_all_settings_controller
 )
-from ...constants.permissions import Role
-from ...utils.helpers import is_user_type_in_allowed_roles
+from ...core.db import get_async_db_session
+from ...constants.permissions import Role, require_role_dependency
 
 router = APIRouter(prefix="/api/v1/settings", tags=["settings"])
 
 
 #Inside the keys were passed as query params
 #Example: /api/v1/settings/keys?keys=key1&keys=key2
-@router.get("/keys", response_model=List[Dict[str, Any]])
+@router.get(
+    "/keys",
+    response_model=List[Dict[str, Any]],
+    dependencies=[Depends(require_role_dependency(Role.OWNER, Role.ADMIN))],
+)
 async def get_settings_by_keys(
-    request: Request,
-    keys: List[str] = Query(..., description="List of setting keys to fetch")
+    keys: List[str] = Query(..., description="List of setting keys to fetch"),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get multiple settings by keys - returns only key and value
@@ -25,16 +30,14 @@ async def get_settings_by_keys(
     if not keys:
         raise HTTPException(status_code=400, detail="At least one key is required")
 
-    # Validate the role is owner or Admin
-    if not is_user_type_in_allowed_roles(request.state.user_type, [Role.OWNER, Role.ADMIN]):
-        raise HTTPException(status_code=403, detail="You are not authorized to access this resource")
-
-    return await get_settings_by_keys_controller(keys)
+    return await get_settings_by_keys_controller(keys, db)
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_all_settings():
+async def get_all_settings(
+    db: AsyncSession = Depends(get_async_db_session),
+):
     """
     Get all settings - returns only key and value
     """
-    return await get_all_settings_controller()
+    return await get_all_settings_controller(db)
@@ -1,13 +1,15 @@
 from typing import Optional, Dict, Any, Tuple, List
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from ...core.db import unit_of_work
 from ..models.setting import Setting
 from .schemas import SettingCreate, SettingUpdate
 
 
 async def create_setting(
-    db: Session,
+    db: AsyncSession,
     setting_data: SettingCreate,
     added_by: str
 ) -> Setting:
@@ -15,35 +17,37 @@ async def create_setting(
     Create a new setting with dict value type
     """
     try:
-        setting = Setting(
-            key=setting_data.key,
-            value=setting_data.value,  # This will be stored as JSON
-            additional_data=setting_data.additional_data,
-            added_by=added_by
-        )
-        db.add(setting)
-        db.commit()
-        db.refresh(setting)
+        async with unit_of_work(db):
+            setting = Setting(
+                key=setting_data.key,
+                value=setting_data.value,  # This will be stored as JSON
+                additional_data=setting_data.additional_data,
+                added_by=added_by
+            )
+            db.add(setting)
+        await db.refresh(setting)
         return setting
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create setting: {str(e)}"
         )
 
 async def get_settings_by_keys(
-    db: Session,
+    db: AsyncSession,
     keys: List[str]
 ) -> List[Tuple[str, Dict[str, Any]]]:
     """
     Get multiple settings by their keys - returns only key and value columns
     """
     try:
-        return db.query(Setting.key, Setting.value).filter(
-            Setting.key.in_(keys),
-            Setting.is_deleted == False
-        ).all()
+        result = await db.execute(
+            select(Setting.key, Setting.value).filter(
+                Setting.key.in_(keys),
+                Setting.is_deleted == False
+            )
+        )
+        return result.all()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -52,7 +56,7 @@ async def get_settings_by_keys(
 
 
 async def update_setting(
-    db: Session,
+    db: AsyncSession,
     setting_id: int,
     setting_data: SettingUpdate,
     modified_by: str
@@ -61,27 +65,29 @@ async def update_setting(
     Update an existing setting
     """
     try:
-        setting = db.query(Setting).filter(
-            Setting.id == setting_id,
-            Setting.is_deleted == False
-        ).first()
+        async with unit_of_work(db):
+            result = await db.execute(
+                select(Setting).filter(
+                    Setting.id == setting_id,
+                    Setting.is_deleted == False
+                )
+            )
+            setting = result.scalars().first()
         
-        if not setting:
-            return None
+            if not setting:
+                return None
             
-        if setting_data.key is not None:
-            setting.key = setting_data.key
-        if setting_data.value is not None:
-            setting.value = setting_data.value
-        if setting_data.additional_data is not None:
-            setting.additional_data = setting_data.additional_data
+            if setting_data.key is not None:
+                setting.key = setting_data.key
+            if setting_data.value is not None:
+                setting.value = setting_data.value
+            if setting_data.additional_data is not None:
+                setting.additional_data = setting_data.additional_data
             
-        setting.modified_by = modified_by
-        db.commit()
-        db.refresh(setting)
+            setting.modified_by = modified_by
+        await db.refresh(setting)
         return setting
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update setting: {str(e)}"
@@ -89,15 +95,18 @@ async def update_setting(
 
 
 async def get_all_settings(
-    db: Session
+    db: AsyncSession
 ) -> List[Tuple[str, Dict[str, Any]]]:
     """
     Get all active settings - returns only key and value columns
     """
     try:
-        return db.query(Setting.key, Setting.value).filter(
-            Setting.is_deleted == False
-        ).all()
+        result = await db.execute(
+            select(Setting.key, Setting.value).filter(
+                Setting.is_deleted == False
+            )
+        )
+        return result.all()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -106,7 +115,7 @@ async def get_all_settings(
 
 
 async def delete_setting(
-    db: Session,
+    db: AsyncSession,
     setting_id: int,
     modified_by: str
 ) -> bool:
@@ -114,20 +123,22 @@ async def delete_setting(
     Soft delete a setting
     """
     try:
-        setting = db.query(Setting).filter(
-            Setting.id == setting_id,
-            Setting.is_deleted == False
-        ).first()
+        async with unit_of_work(db):
+            result = await db.execute(
+                select(Setting).filter(
+                    Setting.id == setting_id,
+                    Setting.is_deleted == False
+                )
+            )
+            setting = result.scalars().first()
         
-        if not setting:
-            return False
+            if not setting:
+                return False
             
-        setting.is_deleted = True
-        setting.modified_by = modified_by
-        db.commit()
+            setting.is_deleted = True
+            setting.modified_by = modified_by
         return True
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete setting: {str(e)}"
@@ -0,0 +1,180 @@
+import asyncio
+import heapq
+import threading
+import time
+from bisect import bisect_right, insort
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.db import AsyncSessionLocal, LATE_COMMIT_WINDOW
+from ..models.vehicle import Vehicle
+
+BucketKey = Tuple[str, str, str]  # (type, availability_status, rental_duration)
+
+
+class AvailabilityIndex:
+    """
+    In-process index of live vehicles: (type, availability_status, rental_duration) -> sorted vehicle ids.
+
+    Built at startup, updated by the vehicle write paths after commit, and refreshed
+    incrementally from the DB so writes made by other workers show up too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[BucketKey, List[str]] = {}
+        self._vehicle_keys: Dict[str, BucketKey] = {}
+        self.ready = False
+        self.synced_at: Optional[datetime] = None
+        self.last_refresh_rows = 0
+        self.last_refresh_ms = 0.0
+
+    def _remove_locked(self, vehicle_id: str) -> None:
+        key = self._vehicle_keys.pop(vehicle_id, None)
+        if key is None:
+            return
+        ids = self._buckets[key]
+        position = bisect_right(ids, vehicle_id) - 1
+        if position >= 0 and ids[position] == vehicle_id:
+            del ids[position]
+        if not ids:
+            del self._buckets[key]
+
+    def upsert(self, vehicle_id: str, vehicle_type: str, availability_status: str, rental_duration: str) -> None:
+        """Add a vehicle or move it to its current bucket"""
+        vehicle_id = str(vehicle_id)
+        key = (vehicle_type, availability_status, rental_duration)
+        with self._lock:
+            if self._vehicle_keys.get(vehicle_id) == key:
+                return
+            self._remove_locked(vehicle_id)
+            insort(self._buckets.setdefault(key, []), vehicle_id)
+            self._vehicle_keys[vehicle_id] = key
+
+    def remove(self, vehicle_id: str) -> None:
+        """Drop a deleted vehicle"""
+        with self._lock:
+            self._remove_locked(str(vehicle_id))
+
+    def _matching_buckets(
+        self, vehicle_type: Optional[str], availability_status: Optional[str], rental_duration: Optional[str]
+    ) -> List[List[str]]:
+        return [
+            ids for (bucket_type, bucket_status, bucket_duration), ids in self._buckets.items()
+            if (vehicle_type is None or bucket_type == vehicle_type)
+            and (availability_status is None or bucket_status == availability_status)
+            and (rental_duration is None or bucket_duration == rental_duration)
+        ]
+
+    def count(
+        self,
+        vehicle_type: Optional[str] = None,
+        availability_status: Optional[str] = None,
+        rental_duration: Optional[str] = None,
+    ) -> int:
+        """Count vehicles matching the filters (None matches any value)"""
+        with self._lock:
+            return sum(len(ids) for ids in self._matching_buckets(vehicle_type, availability_status, rental_duration))
+
+    def list_ids(
+        self,
+        vehicle_type: Optional[str] = None,
+        availability_status: Optional[str] = None,
+        rental_duration: Optional[str] = None,
+        limit: int = 50,
+        after_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        List matching vehicle ids in id order, starting after after_id. Each bucket is read from
+        its bisected start offset in place (no copies), so a page costs O(buckets * log n + limit).
+        """
+        with self._lock:
+            tails = [
+                map(ids.__getitem__, range(bisect_right(ids, after_id) if after_id is not None else 0, len(ids)))
+                for ids in self._matching_buckets(vehicle_type, availability_status, rental_duration)
+            ]
+            return list(islice(heapq.merge(*tails), limit))
+
+    async def load(self, db: AsyncSession) -> None:
+        """Rebuild the index from all live vehicles"""
+        started = time.perf_counter()
+        sync_started_at = datetime.utcnow()
+        rows = (await db.execute(
+            select(Vehicle.id, Vehicle.type, Vehicle.availability_status, Vehicle.rental_duration)
+            .filter(Vehicle.is_deleted == False)
+        )).all()
+
+        buckets: Dict[BucketKey, List[str]] = {}
+        vehicle_keys: Dict[str, BucketKey] = {}
+        for vehicle_id, vehicle_type, availability_status, rental_duration in rows:
+            key = (vehicle_type, availability_status, rental_duration)
+            buckets.setdefault(key, []).append(vehicle_id)
+            vehicle_keys[vehicle_id] = key
+        for ids in buckets.values():
+            ids.sort()
+
+        with self._lock:
+            self._buckets = buckets
+            self._vehicle_keys = vehicle_keys
+        self.ready = True
+        self.synced_at = sync_started_at
+        self.last_refresh_rows = len(rows)
+        self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Apply vehicles added or modified since the last sync"""
+        if self.synced_at is None:
+            await self.load(db)
+            return
+
+        started = time.perf_counter()
+        sync_started_at = datetime.utcnow()
+        since = self.synced_at - LATE_COMMIT_WINDOW
+        rows = (await db.execute(
+            select(Vehicle.id, Vehicle.type, Vehicle.availability_status, Vehicle.rental_duration, Vehicle.is_deleted)
+            .filter(or_(Vehicle.added_date >= since, Vehicle.modified_date >= since))
+        )).all()
+        for vehicle_id, vehicle_type, availability_status, rental_duration, is_deleted in rows:
+            if is_deleted:
+                self.remove(vehicle_id)
+            else:
+                self.upsert(vehicle_id, vehicle_type, availability_status, rental_duration)
+
+        self.synced_at = sync_started_at
+        self.last_refresh_rows = len(rows)
+        self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "vehicles": len(self._vehicle_keys),
+                "buckets": len(self._buckets),
+                "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+                "last_refresh_rows": self.last_refresh_rows,
+                "last_refresh_ms": self.last_refresh_ms,
+            }
+
+
+availability_index = AvailabilityIndex()
+
+
+async def load_availability_index() -> None:
+    """Build the availability index using its own session"""
+    async with AsyncSessionLocal() as db:
+        await availability_index.load(db)
+
+
+async def run_availability_refresher(interval_seconds: float) -> None:
+    """Background loop that applies vehicle changes made by other workers"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await availability_index.refresh(db)
+        except Exception as e:
+            print(f"Error refreshing availability index: {str(e)}")
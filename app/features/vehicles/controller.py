@@ -1,34 +1,155 @@
-from typing import List
+from datetime import timezone
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterator, List, Optional, Tuple
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from .schemas import VehicleCreate, VehicleUpdate, VehicleOut, VehicleOwnerOut
+from ...utils.pagination import encode_cursor, decode_cursor
+from ...utils.etag import make_etag
+from ...core.config import get_settings
+from ..documents.uploads import MultipartUpload
+from .schemas import (
+    VehicleCreate,
+    VehicleUpdate,
+    VehicleOut,
+    VehicleSearchFilters,
+    VehicleAvailabilityOut,
+    VehicleImportError,
+    VehicleImportResult,
+    VehicleStatusBulkUpdate,
+    VehicleStatusBulkUpdateResult,
+    VehicleRow,
+    VehicleOwnerRow,
+    VehicleQuoteRequest,
+    VehicleQuote,
+    VehicleQuoteResult,
+    VehicleFields,
+    DOCUMENT_METADATA_LIST,
+)
+from .pricing import QUOTE_SETTINGS_KEY, QuoteRules, compute_quotes, nan_to_none
+from ..settings.service import get_settings_by_keys
+from .availability import availability_index
+from .importer import get_import_format, iter_vehicle_rows
 from .repository import (
     get_vehicle_by_owner_id,
+    get_owner_vehicles_version,
+    get_vehicle_prices,
     list_vehicles as repo_list_vehicles,
+    search_vehicles as repo_search_vehicles,
     create_vehicle,
+    bulk_create_vehicles,
+    bulk_update_availability_status,
     update_vehicle,
     delete_vehicle as repo_delete_vehicle,
 )
 
 
-async def list_all_vehicles(db: Session) -> List[VehicleOut]:
+def _write_error_status(error: Exception) -> int:
+    message = str(error)
+    if "Not authorized" in message:
+        return status.HTTP_400_BAD_REQUEST
+    if "exceeds" in message:
+        # Document image over DOCUMENT_UPLOAD_MAX_BYTES
+        return status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    if "not found" in message.lower():
+        return status.HTTP_404_NOT_FOUND
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _decode_page_cursor(cursor: Optional[str], size: int = 1) -> Optional[list]:
     try:
-        vehicles = await repo_list_vehicles(db)
-        return [VehicleOut.model_validate(v) for v in vehicles]
+        return decode_cursor(cursor, size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+async def list_all_vehicles(db: AsyncSession, limit: int, cursor: Optional[str] = None) -> Tuple[List[VehicleRow], Optional[str]]:
+    after = _decode_page_cursor(cursor)
+    try:
+        # Fetch one extra row to know whether another page exists
+        vehicles = await repo_list_vehicles(db, limit + 1, after[0] if after else None)
+        next_cursor = encode_cursor([vehicles[limit - 1]["id"]]) if len(vehicles) > limit else None
+        return vehicles[:limit], next_cursor
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list vehicles: {str(e)}",
         )
 
+async def search_all_vehicles(
+    db: AsyncSession, filters: VehicleSearchFilters, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[VehicleRow], Optional[str]]:
+    if filters.min_price is not None and filters.max_price is not None and filters.min_price > filters.max_price:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_price cannot exceed max_price")
+
+    after = _decode_page_cursor(cursor, 2)
+    if after:
+        try:
+            # Prices travel as strings so the keyset compares exact Numeric values; null marks
+            # the segment of vehicles without a price
+            after = (None if after[0] is None else Decimal(after[0]), str(after[1]))
+        except (InvalidOperation, TypeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    try:
+        vehicles = await repo_search_vehicles(db, filters, limit + 1, after)
+        next_cursor = None
+        if len(vehicles) > limit:
+            last = vehicles[limit - 1]
+            price = last["rental_price"]
+            next_cursor = encode_cursor([None if price is None else str(price), last["id"]])
+        return vehicles[:limit], next_cursor
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search vehicles: {str(e)}",
+        )
+
+def get_vehicle_availability(
+    vehicle_type: Optional[str],
+    availability_status: Optional[str],
+    rental_duration: Optional[str],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[VehicleAvailabilityOut, Optional[str]]:
+    if not availability_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Availability index is not loaded yet",
+        )
+    after = _decode_page_cursor(cursor)
+    count = availability_index.count(vehicle_type, availability_status, rental_duration)
+    # Fetch one extra id to know whether another page exists
+    vehicle_ids = availability_index.list_ids(
+        vehicle_type, availability_status, rental_duration, limit + 1, str(after[0]) if after else None
+    )
+    next_cursor = encode_cursor([vehicle_ids[limit - 1]]) if len(vehicle_ids) > limit else None
+    return VehicleAvailabilityOut(count=count, vehicle_ids=vehicle_ids[:limit]), next_cursor
+
+async def get_owner_vehicles_etag(
+    db: AsyncSession, owner_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+) -> str:
+    try:
+        version = await get_owner_vehicles_version(db, owner_id)
+        return make_etag("owner-vehicles", str(owner_id), limit, cursor, *version)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get vehicles by owner id: {str(e)}",
+        )
+
 # Write a function to get the vehicles by owner id
-async def get_vehicles_by_owner_id(db: Session, owner_id: uuid.UUID) -> List[VehicleOwnerOut]:
+async def get_vehicles_by_owner_id(
+    db: AsyncSession, owner_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[VehicleOwnerRow], Optional[str]]:
+    after = _decode_page_cursor(cursor)
     try:
-        vehicles = await get_vehicle_by_owner_id(db, owner_id)
-        result = [VehicleOwnerOut.model_validate(v) for v in vehicles]
-        return result
+        # Fetch one extra row to know whether another page exists
+        vehicles = await get_vehicle_by_owner_id(db, owner_id, limit + 1, after[0] if after else None)
+        next_cursor = encode_cursor([vehicles[limit - 1]["user_vehicle_id"]]) if len(vehicles) > limit else None
+        return vehicles[:limit], next_cursor
     except Exception as e:
         print(f"Error in get_vehicles_by_owner_id: {str(e)}")
         raise HTTPException(
@@ -37,31 +158,188 @@ async def get_vehicles_by_owner_id(db: Session, owner_id: uuid.UUID) -> List[Veh
         )
 
 
-async def create_new_vehicle(db: Session, owner_id: uuid.UUID, data: VehicleCreate) -> VehicleOut:
+async def load_quote_rules(db: AsyncSession) -> QuoteRules:
+    settings_rows = await get_settings_by_keys(db, [QUOTE_SETTINGS_KEY])
+    try:
+        return QuoteRules.from_setting(settings_rows[0][1] if settings_rows else None)
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Invalid {QUOTE_SETTINGS_KEY} setting: {str(e)}",
+        )
+
+async def quote_vehicles(db: AsyncSession, data: VehicleQuoteRequest) -> VehicleQuoteResult:
+    # Naive datetimes are UTC so mixed inputs still compare
+    start = data.start if data.start.tzinfo else data.start.replace(tzinfo=timezone.utc)
+    end = data.end if data.end.tzinfo else data.end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start")
+
+    rules = await load_quote_rules(db)
+    try:
+        vehicles = await get_vehicle_prices(db, data.vehicle_ids)
+        window_seconds = int((end - start).total_seconds())
+        quotes = compute_quotes(
+            window_seconds,
+            [v["rental_duration"] for v in vehicles],
+            [v["rental_price"] for v in vehicles],
+            rules,
+        )
+        found_ids = {v["id"] for v in vehicles}
+        return VehicleQuoteResult(
+            start=start,
+            end=end,
+            hours=round(window_seconds / 3600, 4),
+            quotes=[
+                VehicleQuote(
+                    vehicle_id=v["id"],
+                    rental_duration=v["rental_duration"],
+                    unit_price=v["rental_price"],
+                    units=units,
+                    base_price=base_price,
+                    discount_percent=discount_percent,
+                    price=price,
+                )
+                for v, units, base_price, discount_percent, price in zip(
+                    vehicles,
+                    quotes["units"].tolist(),
+                    nan_to_none(quotes["base_price"]),
+                    quotes["discount_percent"].tolist(),
+                    nan_to_none(quotes["price"]),
+                )
+            ],
+            not_found_ids=list(dict.fromkeys(
+                str(vehicle_id) for vehicle_id in data.vehicle_ids if str(vehicle_id) not in found_ids
+            )),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to quote vehicles: {str(e)}",
+        )
+
+async def create_new_vehicle(db: AsyncSession, owner_id: uuid.UUID, data: VehicleCreate) -> VehicleOut:
     try:
         vehicle = await create_vehicle(db, owner_id, data)
         return VehicleOut.model_validate(vehicle)
     except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_write_error_status(e),
             detail=f"Failed to create vehicle: {str(e)}",
         )
 
-async def edit_vehicle(db: Session, owner_id: uuid.UUID, vehicle_id: uuid.UUID, data: VehicleUpdate) -> VehicleOut:
+async def create_new_vehicle_from_upload(
+    db: AsyncSession, owner_id: uuid.UUID, content_type: Optional[str], chunks: AsyncIterator[bytes]
+) -> VehicleOut:
+    # Files are on disk once parse() returns; anything that stops the vehicle being created removes them
+    upload = await MultipartUpload(content_type, get_settings().document_upload_max_bytes).parse(chunks)
+    try:
+        try:
+            fields = VehicleFields(**{
+                name: upload.field(name) for name in VehicleFields.model_fields if upload.field(name)
+            })
+            documents = DOCUMENT_METADATA_LIST.validate_json(upload.field("documents") or "[]")
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=jsonable_encoder(e.errors()))
+        if any(stored.field_name != "document_image" for stored in upload.files):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Files must be sent as document_image parts")
+        if len(documents) != len(upload.files):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Got {len(upload.files)} document_image files for {len(documents)} documents entries",
+            )
+
+        try:
+            vehicle = await create_vehicle(
+                db,
+                owner_id,
+                VehicleCreate(**fields.model_dump(), documents=[]),
+                stored_documents=[(metadata, stored.content()) for metadata, stored in zip(documents, upload.files)],
+            )
+            return VehicleOut.model_validate(vehicle)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=_write_error_status(e),
+                detail=f"Failed to create vehicle: {str(e)}",
+            )
+    except BaseException:
+        upload.discard()
+        raise
+
+async def import_vehicles(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    content_type: Optional[str],
+    chunks: AsyncIterator[bytes],
+    batch_size: int,
+) -> VehicleImportResult:
+    import_format = get_import_format(content_type)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Content-Type must be application/x-ndjson or text/csv",
+        )
+
+    result = VehicleImportResult()
+    batch: List[Tuple[int, VehicleCreate]] = []
+
+    async def write_batch() -> None:
+        # Each batch is its own transaction; a failed batch is reported row by row and the import goes on
+        try:
+            vehicle_ids = await bulk_create_vehicles(db, owner_id, [vehicle for _, vehicle in batch])
+            result.vehicle_ids.extend(vehicle_ids)
+            result.created += len(vehicle_ids)
+        except Exception as e:
+            print(f"Error in import_vehicles: {str(e)}")
+            result.failed += len(batch)
+            result.errors.extend(VehicleImportError(line=line, error=str(e)) for line, _ in batch)
+        batch.clear()
+
+    async for line, vehicle, error in iter_vehicle_rows(import_format, chunks):
+        result.total_rows += 1
+        if error is not None:
+            result.failed += 1
+            result.errors.append(VehicleImportError(line=line, error=error))
+            continue
+        batch.append((line, vehicle))
+        if len(batch) >= batch_size:
+            await write_batch()
+    if batch:
+        await write_batch()
+
+    return result
+
+async def update_availability_statuses(
+    db: AsyncSession, owner_id: uuid.UUID, data: VehicleStatusBulkUpdate
+) -> VehicleStatusBulkUpdateResult:
+    try:
+        updated_ids, unchanged_ids, not_found_ids = await bulk_update_availability_status(
+            db, owner_id, data.vehicle_ids, data.availability_status
+        )
+        return VehicleStatusBulkUpdateResult(
+            updated_ids=updated_ids, unchanged_ids=unchanged_ids, not_found_ids=not_found_ids
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+async def edit_vehicle(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID, data: VehicleUpdate) -> VehicleOut:
     try:
         vehicle = await update_vehicle(db, owner_id, vehicle_id, data)
         return VehicleOut.model_validate(vehicle)
     except Exception as e:
-        status_code = status.HTTP_400_BAD_REQUEST if "Not authorized" in str(e) else status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_500_INTERNAL_SERVER_ERROR
-        raise HTTPException(status_code=status_code, detail=str(e))
+        raise HTTPException(status_code=_write_error_status(e), detail=str(e))
 
 
-async def remove_vehicle(db: Session, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> dict:
+async def remove_vehicle(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> dict:
     try:
         await repo_delete_vehicle(db, owner_id, vehicle_id)
         return {"message": "Vehicle deleted successfully"}
     except Exception as e:
-        status_code = status.HTTP_400_BAD_REQUEST if "Not authorized" in str(e) else status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_500_INTERNAL_SERVER_ERROR
-        raise HTTPException(status_code=status_code, detail=str(e))
+        raise HTTPException(status_code=_write_error_status(e), detail=str(e))
 
 
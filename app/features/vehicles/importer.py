@@ -0,0 +1,111 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from .schemas import VehicleCreate
+
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/json-lines"}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+# A single row never needs more than this; longer lines are reported and skipped
+MAX_LINE_CHARS = 64 * 1024
+
+ImportRow = Tuple[int, Optional[VehicleCreate], Optional[str]]  # (line, vehicle, error)
+
+
+def get_import_format(content_type: Optional[str]) -> Optional[str]:
+    """Map a request Content-Type to "ndjson" or "csv" (None if unsupported)"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[str]]:
+    """
+    Split a byte stream into text lines without buffering the whole body.
+    Yields None in place of a line longer than MAX_LINE_CHARS.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    overflow = False
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line = line.rstrip("\r")
+            # A line is too long if it overflowed while buffered or ends within this chunk past the cap
+            yield None if overflow or len(line) > MAX_LINE_CHARS else line
+            overflow = False
+        if len(buffer) > MAX_LINE_CHARS:
+            buffer = ""
+            overflow = True
+    buffer = (buffer + decoder.decode(b"", final=True)).rstrip("\r")
+    if overflow or len(buffer) > MAX_LINE_CHARS:
+        yield None
+    elif buffer.strip():
+        yield buffer
+
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+    )
+
+
+def parse_vehicle_row(fields: dict) -> VehicleCreate:
+    """Validate one imported row; bulk import creates vehicles without documents"""
+    if fields.get("documents"):
+        raise ValueError("documents are not supported by bulk import, upload them with update-vehicle")
+    return VehicleCreate.model_validate({**fields, "documents": []})
+
+
+def _to_import_row(line_number: int, fields) -> ImportRow:
+    try:
+        if not isinstance(fields, dict):
+            raise ValueError("row must be an object")
+        return line_number, parse_vehicle_row(fields), None
+    except ValidationError as e:
+        return line_number, None, _validation_message(e)
+    except ValueError as e:
+        return line_number, None, str(e)
+
+
+async def iter_vehicle_rows(import_format: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """Parse an NDJSON or CSV stream into validated vehicles or per-line errors"""
+    header: Optional[List[str]] = None
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if line is None:
+            yield line_number, None, f"line exceeds {MAX_LINE_CHARS} characters"
+            continue
+        if not line.strip():
+            continue
+
+        if import_format == "ndjson":
+            try:
+                fields = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"invalid JSON: {e.msg}"
+                continue
+            yield _to_import_row(line_number, fields)
+            continue
+
+        # Quoted fields spanning several lines are not supported
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty cells mean "not provided" so optional fields fall back to their defaults
+        fields = {name: value.strip() for name, value in zip(header, values) if value.strip() != ""}
+        yield _to_import_row(line_number, fields)
@@ -0,0 +1,96 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Setting holding quote rules, e.g.
+# {"round_to": 1, "discount_tiers": {"day": [{"min_units": 7, "percent": 10}, {"min_units": 30, "percent": 20}]}}
+QUOTE_SETTINGS_KEY = "rental_quote"
+
+DEFAULT_ROUND_TO = 0.01
+
+# Billing unit length per rental_duration; a month is billed as 30 days
+DURATIONS = ("hour", "day", "week", "month")
+UNIT_SECONDS = np.array([3600, 86400, 7 * 86400, 30 * 86400], dtype=np.int64)
+DURATION_CODES = {duration: code for code, duration in enumerate(DURATIONS)}
+
+
+class QuoteRules:
+    """Discount tiers per rental_duration and price rounding, parsed once from the settings value"""
+
+    def __init__(self, discount_tiers: Dict[str, List[Tuple[int, float]]], round_to: float = DEFAULT_ROUND_TO):
+        if round_to <= 0:
+            raise ValueError("round_to must be positive")
+        self.round_to = round_to
+        # Per duration code: ascending unit thresholds and the percent applying from each one
+        self.tiers: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        for duration, tiers in discount_tiers.items():
+            if duration not in DURATION_CODES:
+                raise ValueError(f"Unknown rental duration in discount tiers: {duration}")
+            tiers = sorted(tiers)
+            self.tiers[DURATION_CODES[duration]] = (
+                np.array([min_units for min_units, _ in tiers], dtype=np.int64),
+                np.array([percent for _, percent in tiers], dtype=np.float64),
+            )
+
+    @classmethod
+    def from_setting(cls, value: Optional[dict]) -> "QuoteRules":
+        """Build rules from the QUOTE_SETTINGS_KEY setting value (missing setting means no discounts)"""
+        value = value or {}
+        discount_tiers = {}
+        for duration, tiers in (value.get("discount_tiers") or {}).items():
+            parsed = []
+            for tier in tiers:
+                percent = float(tier["percent"])
+                if not 0 <= percent <= 100:
+                    raise ValueError("Discount percent must be between 0 and 100")
+                parsed.append((int(tier["min_units"]), percent))
+            discount_tiers[duration] = parsed
+        return cls(discount_tiers, float(value.get("round_to", DEFAULT_ROUND_TO)))
+
+
+def compute_quotes(
+    window_seconds: int,
+    rental_durations: List[str],
+    unit_prices: List[Optional[float]],
+    rules: QuoteRules,
+) -> Dict[str, np.ndarray]:
+    """
+    Price one booking window for many vehicles in a single vectorized pass.
+
+    Each vehicle is billed in whole units of its rental_duration (partial units round up,
+    at least one unit), the duration's discount tier for that unit count is applied, and
+    the result is rounded half-up to rules.round_to. Vehicles without a price get NaN.
+
+    Returns arrays keyed units, base_price, discount_percent and price, aligned with the inputs.
+    """
+    codes = np.fromiter((DURATION_CODES[d] for d in rental_durations), dtype=np.int64, count=len(rental_durations))
+    prices = np.array([np.nan if p is None else p for p in unit_prices], dtype=np.float64)
+
+    unit_seconds = UNIT_SECONDS[codes]
+    # Integer ceiling division keeps exact multiples (e.g. 48h at a daily rate) from rounding up
+    units = np.maximum(-(-window_seconds // unit_seconds), 1)
+    base = units * prices
+
+    discount = np.zeros(len(codes), dtype=np.float64)
+    for code, (thresholds, percents) in rules.tiers.items():
+        mask = codes == code
+        if not mask.any() or thresholds.size == 0:
+            continue
+        tier = np.searchsorted(thresholds, units[mask], side="right") - 1
+        discount[mask] = np.where(tier >= 0, percents[np.clip(tier, 0, None)], 0.0)
+
+    # Round half-up on the rounding step, then to cents to drop float noise
+    steps = base * (1 - discount / 100) / rules.round_to
+    price = np.round(np.floor(steps + 0.5) * rules.round_to, 2)
+    return {
+        "units": units,
+        "base_price": np.round(base, 2),
+        "discount_percent": discount,
+        "price": price,
+    }
+
+
+def nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    """Convert a float array to JSON-ready floats, NaN becoming None"""
+    return [None if math.isnan(value) else value for value in values.tolist()]
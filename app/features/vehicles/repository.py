@@ -1,189 +1,480 @@
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Tuple
 
 from ...constants.permissions import EntityType, Role, Status
-from ..documents.service import create_multiple_documents, update_documents_for_entity
-from sqlalchemy.orm import Session
+from ...core.db import unit_of_work
+from ...utils.serialization import rows_as_dicts
+from ..documents.service import create_multiple_documents, create_documents_from_files, update_documents_for_entity
+from ..documents.storage import DocumentContent
+from sqlalchemy import Numeric, Select, and_, func, insert, select, tuple_, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from ..models.vehicle import Vehicle
 from ..models.user_vehicle import UserVehicle
-from .schemas import VehicleCreate, VehicleUpdate
+from .schemas import DocumentMetadata, VehicleCreate, VehicleUpdate, VehicleSearchFilters
+from .availability import availability_index
 
 
-async def list_vehicles(db: Session) -> List[Vehicle]:
+# Prices are read as floats so rows serialize straight into the response schema
+RENTAL_PRICE_AS_FLOAT = type_coerce(Vehicle.rental_price, Numeric(10, 2, asdecimal=False)).label("rental_price")
+
+# Columns of VehicleOut, selected instead of whole entities for list endpoints
+VEHICLE_OUT_COLUMNS = (
+    Vehicle.id,
+    Vehicle.name,
+    Vehicle.type,
+    Vehicle.availability_status,
+    Vehicle.rental_duration,
+    RENTAL_PRICE_AS_FLOAT,
+    Vehicle.is_deleted,
+)
+
+
+async def list_vehicles(db: AsyncSession, limit: Optional[int] = None, after_id: Optional[str] = None) -> List[dict]:
     try:
-        return db.query(Vehicle).filter(Vehicle.is_deleted == False).all()
+        # Keyset pagination on the primary key keeps every page an index range scan
+        query = select(*VEHICLE_OUT_COLUMNS).filter(Vehicle.is_deleted == False)
+        if after_id is not None:
+            query = query.filter(Vehicle.id > after_id)
+        query = query.order_by(Vehicle.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return rows_as_dicts(await db.execute(query))
     except Exception as e:
         raise Exception(f"Failed to list vehicles: {str(e)}")
 
 
-async def create_vehicle(db: Session, owner_id: uuid.UUID, data: VehicleCreate) -> Vehicle:
+def _filter_vehicle_search(query: Select, filters: VehicleSearchFilters) -> Select:
+    query = query.filter(Vehicle.is_deleted == False)
+    if filters.type is not None:
+        query = query.filter(Vehicle.type == filters.type)
+    if filters.availability_status is not None:
+        query = query.filter(Vehicle.availability_status == filters.availability_status)
+    if filters.rental_duration is not None:
+        query = query.filter(Vehicle.rental_duration == filters.rental_duration)
+    return query
+
+
+def build_vehicle_search_query(
+    filters: VehicleSearchFilters,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[Decimal, str]] = None,
+) -> Select:
+    """
+    Build the search query for priced vehicles; ordered by (rental_price, id). Each of the eight
+    combinations of the type/availability_status/rental_duration filters has its own
+    ix_vehicles_search_* index ending in rental_price, so pages are index range scans without
+    a filesort.
+    """
+    query = _filter_vehicle_search(select(*VEHICLE_OUT_COLUMNS), filters).filter(Vehicle.rental_price.isnot(None))
+    if filters.min_price is not None:
+        query = query.filter(Vehicle.rental_price >= filters.min_price)
+    if filters.max_price is not None:
+        query = query.filter(Vehicle.rental_price <= filters.max_price)
+    if after is not None:
+        query = query.filter(tuple_(Vehicle.rental_price, Vehicle.id) > tuple_(*after))
+    query = query.order_by(Vehicle.rental_price, Vehicle.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def build_unpriced_vehicle_search_query(
+    filters: VehicleSearchFilters,
+    limit: Optional[int] = None,
+    after_id: Optional[str] = None,
+) -> Select:
+    """
+    Build the query for vehicles without a rental price, ordered by id. The same indexes serve
+    it: rental_price IS NULL is an equality on their last column, after which InnoDB orders by id.
+    """
+    query = _filter_vehicle_search(select(*VEHICLE_OUT_COLUMNS), filters).filter(Vehicle.rental_price.is_(None))
+    if after_id is not None:
+        query = query.filter(Vehicle.id > after_id)
+    query = query.order_by(Vehicle.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+async def search_vehicles(
+    db: AsyncSession,
+    filters: VehicleSearchFilters,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[Optional[Decimal], str]] = None,
+) -> List[dict]:
+    """
+    Search vehicles cheapest first. Without a price filter, vehicles that have no price follow
+    the priced ones as a final segment; after is (None, id) once paging has reached it.
+    """
     try:
-        vehicle = Vehicle(
-            name=data.name,
-            type=data.type,
-            rental_duration=data.rental_duration,
-            rental_price=data.rental_price,
-            availability_status=data.availability_status,
-            added_by=str(owner_id)
-        )
-        db.add(vehicle)
-        db.flush()
-
-        linkVehicleOwner = UserVehicle(
-            user_id=owner_id,
-            vehicle_id=vehicle.id,
-            ownership_type=Role.OWNER,
-            ownership_status=Status.ACTIVE,
-            ownership_start_date=datetime.utcnow(),
-        )
-        db.add(linkVehicleOwner)
-        
-        # Create documents for the vehicle
-        if data.documents:
-            await create_multiple_documents(
-                db=db,
-                documents_data=data.documents,
-                entity_type=EntityType.VEHICLE,
-                entity_id=vehicle.id,
+        vehicles = []
+        if after is None or after[0] is not None:
+            vehicles = rows_as_dicts(await db.execute(build_vehicle_search_query(filters, limit, after)))
+        if filters.min_price is None and filters.max_price is None and (limit is None or len(vehicles) < limit):
+            vehicles += rows_as_dicts(await db.execute(build_unpriced_vehicle_search_query(
+                filters,
+                limit - len(vehicles) if limit is not None else None,
+                after[1] if after is not None and after[0] is None else None,
+            )))
+        return vehicles
+    except Exception as e:
+        raise Exception(f"Failed to search vehicles: {str(e)}")
+
+
+async def create_vehicle(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    data: VehicleCreate,
+    stored_documents: Optional[List[Tuple[DocumentMetadata, DocumentContent]]] = None,
+) -> Vehicle:
+    """Create a vehicle and its owner link; stored_documents are hashed files already on disk (multipart uploads)"""
+    try:
+        async with unit_of_work(db):
+            vehicle = Vehicle(
+                name=data.name,
+                type=data.type,
+                rental_duration=data.rental_duration,
+                rental_price=data.rental_price,
+                availability_status=data.availability_status,
                 added_by=str(owner_id)
             )
+            db.add(vehicle)
+            await db.flush()
+
+            linkVehicleOwner = UserVehicle(
+                user_id=owner_id,
+                vehicle_id=vehicle.id,
+                ownership_type=Role.OWNER,
+                ownership_status=Status.ACTIVE,
+                ownership_start_date=datetime.utcnow(),
+            )
+            db.add(linkVehicleOwner)
         
-        db.commit()
-        db.refresh(vehicle)
+            # Create documents for the vehicle
+            if data.documents:
+                await create_multiple_documents(
+                    db=db,
+                    documents_data=data.documents,
+                    entity_type=EntityType.VEHICLE,
+                    entity_id=vehicle.id,
+                    added_by=str(owner_id)
+                )
+            if stored_documents:
+                await create_documents_from_files(
+                    db=db,
+                    documents=stored_documents,
+                    entity_type=EntityType.VEHICLE,
+                    entity_id=vehicle.id,
+                    added_by=str(owner_id)
+                )
+        
+        await db.refresh(vehicle)
+        availability_index.upsert(vehicle.id, vehicle.type, vehicle.availability_status, vehicle.rental_duration)
         return vehicle
     except Exception as e:
-        db.rollback()
         raise Exception(f"Failed to create vehicle: {str(e)}")
 
 
-async def get_vehicle_by_id(db: Session, vehicle_id: uuid.UUID) -> Optional[Vehicle]:
+async def get_vehicle_prices(db: AsyncSession, vehicle_ids: List[str]) -> List[dict]:
+    """Fetch id, rental_duration and rental_price of live vehicles for quoting"""
+    try:
+        return rows_as_dicts(await db.execute(
+            select(Vehicle.id, Vehicle.rental_duration, RENTAL_PRICE_AS_FLOAT)
+            .filter(Vehicle.id.in_([str(vehicle_id) for vehicle_id in vehicle_ids]), Vehicle.is_deleted == False)
+        ))
+    except Exception as e:
+        raise Exception(f"Failed to get vehicle prices: {str(e)}")
+
+
+def _active_owner_link(owner_id: uuid.UUID) -> tuple:
+    """Conditions joining vehicles to the caller's active, non-deleted ownership row"""
+    return (
+        UserVehicle.vehicle_id == Vehicle.id,
+        UserVehicle.user_id == str(owner_id),
+        UserVehicle.ownership_type == 'owner',
+        UserVehicle.ownership_status == 'active',
+        UserVehicle.is_deleted == False,
+    )
+
+
+async def bulk_update_availability_status(
+    db: AsyncSession, owner_id: uuid.UUID, vehicle_ids: List[str], availability_status: str
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Set availability_status on the caller's vehicles in one UPDATE joined against
+    user_vehicles. Returns (updated_ids, unchanged_ids, not_found_ids).
+    """
+    try:
+        async with unit_of_work(db):
+            vehicle_ids = list(dict.fromkeys(str(vehicle_id) for vehicle_id in vehicle_ids))
+            # MySQL has no UPDATE ... RETURNING: lock the owned rows first so the changed set is exact
+            owned = (await db.execute(
+                select(Vehicle.id, Vehicle.type, Vehicle.availability_status, Vehicle.rental_duration)
+                .join(UserVehicle, and_(*_active_owner_link(owner_id)))
+                .filter(Vehicle.id.in_(vehicle_ids), Vehicle.is_deleted == False)
+                .with_for_update()
+            )).all()
+            owned_ids = {row.id for row in owned}
+            changed = [row for row in owned if row.availability_status != availability_status]
+
+            if changed:
+                await db.execute(
+                    update(Vehicle)
+                    .where(
+                        Vehicle.id.in_([row.id for row in changed]),
+                        Vehicle.is_deleted == False,
+                        *_active_owner_link(owner_id),
+                    )
+                    .values(
+                        availability_status=availability_status,
+                        modified_date=datetime.utcnow(),
+                        modified_by=str(owner_id),
+                        version=Vehicle.version + 1,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+        for row in changed:
+            availability_index.upsert(row.id, row.type, availability_status, row.rental_duration)
+        changed_ids = {row.id for row in changed}
+        return (
+            [vehicle_id for vehicle_id in vehicle_ids if vehicle_id in changed_ids],
+            [vehicle_id for vehicle_id in vehicle_ids if vehicle_id in owned_ids and vehicle_id not in changed_ids],
+            [vehicle_id for vehicle_id in vehicle_ids if vehicle_id not in owned_ids],
+        )
+    except Exception as e:
+        raise Exception(f"Failed to update availability status: {str(e)}")
+
+
+async def bulk_create_vehicles(db: AsyncSession, owner_id: uuid.UUID, rows: List[VehicleCreate]) -> List[str]:
+    """
+    Create vehicles and their owner links in one transaction using one multi-row
+    INSERT per table. Documents are not created.
+    """
+    try:
+        async with unit_of_work(db):
+            owner_id = str(owner_id)
+            now = datetime.utcnow()
+            vehicle_rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": data.name,
+                    "type": data.type,
+                    "rental_duration": data.rental_duration,
+                    "rental_price": data.rental_price,
+                    "availability_status": data.availability_status,
+                    "is_deleted": False,
+                    "added_date": now,
+                    "added_by": owner_id,
+                    "version": 1,
+                }
+                for data in rows
+            ]
+            await db.execute(insert(Vehicle), vehicle_rows)
+            await db.execute(
+                insert(UserVehicle),
+                [
+                    {
+                        "user_id": owner_id,
+                        "vehicle_id": row["id"],
+                        "ownership_type": Role.OWNER,
+                        "ownership_status": Status.ACTIVE,
+                        "ownership_start_date": now,
+                        "is_deleted": False,
+                    }
+                    for row in vehicle_rows
+                ],
+            )
+
+        for row in vehicle_rows:
+            availability_index.upsert(row["id"], row["type"], row["availability_status"], row["rental_duration"])
+        return [row["id"] for row in vehicle_rows]
+    except Exception as e:
+        raise Exception(f"Failed to import vehicles: {str(e)}")
+
+
+async def get_vehicle_by_id(db: AsyncSession, vehicle_id: uuid.UUID) -> Optional[Vehicle]:
     try:
-        return db.query(Vehicle).filter(Vehicle.id == vehicle_id, Vehicle.is_deleted == False).first()
+        result = await db.execute(
+            select(Vehicle).filter(Vehicle.id == str(vehicle_id), Vehicle.is_deleted == False)
+        )
+        return result.scalars().first()
     except Exception as e:
         raise Exception(f"Failed to get vehicle: {str(e)}")
 
 
-async def is_owner_of_vehicle(db: Session, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> bool:
+async def is_owner_of_vehicle(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> bool:
     try:
-        link = db.query(UserVehicle).filter(
-            UserVehicle.user_id == owner_id,
-            UserVehicle.vehicle_id == vehicle_id,
-            UserVehicle.ownership_type == 'owner',
-            UserVehicle.ownership_status == 'active',
-            UserVehicle.is_deleted == False,
-        ).first()
-        return link is not None
+        result = await db.execute(
+            select(UserVehicle.id).filter(
+                UserVehicle.user_id == str(owner_id),
+                UserVehicle.vehicle_id == str(vehicle_id),
+                UserVehicle.ownership_type == 'owner',
+                UserVehicle.ownership_status == 'active',
+                UserVehicle.is_deleted == False,
+            )
+        )
+        return result.first() is not None
     except Exception as e:
         raise Exception(f"Failed to verify ownership: {str(e)}")
 
 
-async def update_vehicle(db: Session, owner_id: uuid.UUID, vehicle_id: uuid.UUID, data: VehicleUpdate) -> Vehicle:
+async def get_vehicle_for_owner_update(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> Vehicle:
+    """
+    Load and lock a vehicle together with the caller's ownership in one round trip.
+    Raises "Vehicle not found" or "Not authorized" so callers can map the failure.
+    """
+    row = (await db.execute(
+        select(Vehicle, UserVehicle.id)
+        .outerjoin(UserVehicle, and_(*_active_owner_link(owner_id)))
+        .filter(Vehicle.id == str(vehicle_id), Vehicle.is_deleted == False)
+        .limit(1)
+        .with_for_update(of=Vehicle)
+    )).first()
+    if row is None:
+        raise Exception("Vehicle not found")
+    vehicle, owner_link_id = row
+    if owner_link_id is None:
+        raise Exception("Not authorized to update this vehicle")
+    return vehicle
+
+
+async def update_vehicle(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID, data: VehicleUpdate) -> Vehicle:
     try:
-        vehicle = await get_vehicle_by_id(db, vehicle_id)
-        if vehicle is None:
-            raise Exception("Vehicle not found")
-
-        if not await is_owner_of_vehicle(db, owner_id, vehicle_id):
-            raise Exception("Not authorized to update this vehicle")
-        if data.name is not None:
-            vehicle.name = data.name
-        if data.type is not None:
-            vehicle.type = data.type
-        if data.rental_duration is not None:
-            vehicle.rental_duration = data.rental_duration
-        if data.rental_price is not None:
-            vehicle.rental_price = data.rental_price
-        if data.availability_status is not None:
-            vehicle.availability_status = data.availability_status
-
-        # Update documents if provided
-        if data.documents is not None:
-            await update_documents_for_entity(
-                db=db,
-                entity_type=EntityType.VEHICLE,
-                entity_id=vehicle_id,
-                documents_data=data.documents,
-                modified_by=str(owner_id)
-            )
+        async with unit_of_work(db):
+            vehicle = await get_vehicle_for_owner_update(db, owner_id, vehicle_id)
+            if data.name is not None:
+                vehicle.name = data.name
+            if data.type is not None:
+                vehicle.type = data.type
+            if data.rental_duration is not None:
+                vehicle.rental_duration = data.rental_duration
+            if data.rental_price is not None:
+                vehicle.rental_price = data.rental_price
+            if data.availability_status is not None:
+                vehicle.availability_status = data.availability_status
+
+            # Update documents if provided
+            if data.documents is not None:
+                await update_documents_for_entity(
+                    db=db,
+                    entity_type=EntityType.VEHICLE,
+                    entity_id=vehicle.id,
+                    documents_data=data.documents,
+                    modified_by=str(owner_id)
+                )
 
-        vehicle.modified_date = datetime.utcnow()
-        vehicle.modified_by = str(owner_id)
-        db.commit()
-        db.refresh(vehicle)
+            vehicle.modified_date = datetime.utcnow()
+            vehicle.modified_by = str(owner_id)
+
+        # Every column was just set in Python and sessions do not expire on commit, so no refresh is needed
+        availability_index.upsert(vehicle.id, vehicle.type, vehicle.availability_status, vehicle.rental_duration)
         return vehicle
     except Exception as e:
-        db.rollback()
         raise Exception(f"Failed to update vehicle: {str(e)}")
 
 
-async def delete_vehicle(db: Session, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> None:
+async def delete_vehicle(db: AsyncSession, owner_id: uuid.UUID, vehicle_id: uuid.UUID) -> None:
     try:
-        vehicle = await get_vehicle_by_id(db, vehicle_id)
-        if vehicle is None:
-            raise Exception("Vehicle not found")
+        async with unit_of_work(db):
+            # One multi-table UPDATE soft-deletes the vehicle and its ownership row, but only
+            # when the caller actively owns it
+            result = await db.execute(
+                update(Vehicle)
+                .where(
+                    Vehicle.id == str(vehicle_id),
+                    Vehicle.is_deleted == False,
+                    *_active_owner_link(owner_id),
+                )
+                .values({
+                    Vehicle.is_deleted: True,
+                    Vehicle.modified_date: datetime.utcnow(),
+                    Vehicle.modified_by: str(owner_id),
+                    Vehicle.version: Vehicle.version + 1,
+                    UserVehicle.is_deleted: True,
+                })
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                # Only failed deletes pay for a second query, to tell the two cases apart
+                if await get_vehicle_by_id(db, vehicle_id) is None:
+                    raise Exception("Vehicle not found")
+                raise Exception("Not authorized to delete this vehicle")
 
-        if not await is_owner_of_vehicle(db, owner_id, vehicle_id):
-            raise Exception("Not authorized to delete this vehicle")
+        availability_index.remove(vehicle_id)
+    except Exception as e:
+        raise Exception(f"Failed to delete vehicle: {str(e)}")
 
-        vehicle.is_deleted = True
-        vehicle.modified_date = datetime.utcnow()
-        vehicle.modified_by = str(owner_id)
 
-        # soft-delete ownership row as well
-        db.query(UserVehicle).filter(
-            UserVehicle.user_id == owner_id,
-            UserVehicle.vehicle_id == vehicle_id,
-            UserVehicle.ownership_type == 'owner',
-        ).update({UserVehicle.is_deleted: True})
 
-        db.commit()
+async def get_owner_vehicles_version(db: AsyncSession, owner_id: uuid.UUID) -> Tuple[int, int, int]:
+    """
+    Cheap fingerprint of an owner's vehicle list: (count, newest ownership row id, sum of
+    vehicle versions). Any create, update or delete changes at least one component.
+    """
+    try:
+        count, last_link_id, version_sum = (await db.execute(
+            select(func.count(UserVehicle.id), func.max(UserVehicle.id), func.sum(Vehicle.version))
+            .join(Vehicle, UserVehicle.vehicle_id == Vehicle.id)
+            .filter(
+                UserVehicle.user_id == str(owner_id),
+                UserVehicle.ownership_type == 'owner',
+                UserVehicle.ownership_status == 'active',
+                UserVehicle.is_deleted == False,
+                Vehicle.is_deleted == False,
+            )
+        )).one()
+        return count, last_link_id or 0, int(version_sum or 0)
     except Exception as e:
-        db.rollback()
-        raise Exception(f"Failed to delete vehicle: {str(e)}")
+        raise Exception(f"Failed to get owner vehicles version: {str(e)}")
+
 
+def build_owner_vehicles_query(owner_id: uuid.UUID, limit: Optional[int] = None, after_id: Optional[int] = None) -> Select:
+    """
+    Build the owner vehicle list query. Columns are labelled with VehicleOwnerOut field
+    names so rows serialize straight into the response schema.
+    """
+    query = select(
+        # Fields from UserVehicle table
+        UserVehicle.id.label('user_vehicle_id'),
+        UserVehicle.ownership_type,
+        # Fields from Vehicle table
+        Vehicle.id.label('vehicle_id'),
+        Vehicle.name.label('vehicle_name'),
+        Vehicle.type.label('vehicle_type'),
+        Vehicle.rental_duration,
+        RENTAL_PRICE_AS_FLOAT,
+        Vehicle.availability_status,
+    ).join(
+        Vehicle,
+        UserVehicle.vehicle_id == Vehicle.id
+    ).filter(
+        UserVehicle.user_id == str(owner_id),
+        UserVehicle.ownership_type == 'owner',
+        UserVehicle.ownership_status == 'active',
+        UserVehicle.is_deleted == False,
+        Vehicle.is_deleted == False
+    )
+    # Keyset pagination on user_vehicles.id (stable, unique, indexed)
+    if after_id is not None:
+        query = query.filter(UserVehicle.id > after_id)
+    query = query.order_by(UserVehicle.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
 
 
 # Write a function to get specific fields from both user_vehicles and vehicles tables
-async def get_vehicle_by_owner_id(db: Session, owner_id: uuid.UUID) -> List[dict]:
+async def get_vehicle_by_owner_id(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> List[dict]:
     try:
-        results = db.query(
-            # Fields from UserVehicle table
-            UserVehicle.id,
-            UserVehicle.ownership_type,
-            # Fields from Vehicle table
-            Vehicle.id.label('vehicle_id'),
-            Vehicle.name,
-            Vehicle.type,
-            Vehicle.rental_duration,
-            Vehicle.rental_price,
-            Vehicle.availability_status,
-        ).join(
-            Vehicle,
-            UserVehicle.vehicle_id == Vehicle.id
-        ).filter(
-            UserVehicle.user_id == owner_id,
-            UserVehicle.ownership_type == 'owner',
-            UserVehicle.ownership_status == 'active',
-            UserVehicle.is_deleted == False,
-            Vehicle.is_deleted == False
-        ).all()
-        
-        return [
-            {
-                # UserVehicle fields
-                "user_vehicle_id": id,
-                "ownership_type": ownership_type,
-                # Vehicle fields
-                "vehicle_id": vehicle_id,
-                "vehicle_name": name,
-                "vehicle_type": type,
-                "rental_duration": rental_duration,
-                "rental_price": rental_price,
-                "availability_status": availability_status,
-            }
-            for id, ownership_type, vehicle_id, name, type, rental_duration, rental_price, availability_status in results
-        ]
+        return rows_as_dicts(await db.execute(build_owner_vehicles_query(owner_id, limit, after_id)))
     except Exception as e:
-        raise Exception(f"Failed to get vehicles by owner id: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to get vehicles by owner id: {str(e)}")
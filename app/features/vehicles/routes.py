@@ -1,14 +1,39 @@
-from fastapi import APIRouter, Depends, status, Request, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
+from fastapi import APIRouter, Depends, status, Request, Response, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from ...core.db import get_db_session
-from ...constants.permissions import Role
-from ...utils.helpers import is_user_type_in_allowed_roles
-from .schemas import VehicleCreate, VehicleUpdate, VehicleOut, VehicleOwnerOut
+from ...core.db import get_async_db_session
+from ...constants.permissions import Permission, Role, require_permission_dependency, require_role_dependency
+from ...utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ...utils.etag import etag_matches, not_modified_response, set_etag_headers
+from ...utils.serialization import adapter_response
+from .schemas import (
+    VehicleCreate,
+    VehicleUpdate,
+    VehicleOut,
+    VehicleOwnerOut,
+    VehicleSearchFilters,
+    VehicleAvailabilityOut,
+    VehicleImportResult,
+    VehicleStatusBulkUpdate,
+    VehicleStatusBulkUpdateResult,
+    VehicleQuoteRequest,
+    VehicleQuoteResult,
+    VEHICLE_ROWS,
+    VEHICLE_OWNER_ROWS,
+)
 from .controller import (
+    list_all_vehicles,
+    search_all_vehicles,
+    get_vehicle_availability,
+    quote_vehicles,
     get_vehicles_by_owner_id,
+    get_owner_vehicles_etag,
     create_new_vehicle,
+    create_new_vehicle_from_upload,
+    import_vehicles,
+    update_availability_statuses,
     edit_vehicle,
     remove_vehicle,
 )
@@ -16,17 +41,30 @@ from .controller import (
 router = APIRouter(prefix="/api/v1/vehicles", tags=["vehicles"])
 
 # Write a function to get the vehicles by owner id
-@router.get("/get-owner-vehicles", response_model=list[VehicleOwnerOut])
+@router.get(
+    "/get-owner-vehicles",
+    response_model=list[VehicleOwnerOut],
+    dependencies=[Depends(require_role_dependency(Role.OWNER, Role.ADMIN))],
+)
 async def owner_vehicles(
     Request: Request,
-    db: Session = Depends(get_db_session),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     try:
-        # Check if user has required role (Owner or Admin)
-        if not is_user_type_in_allowed_roles(Request.state.user_type, [Role.OWNER, Role.ADMIN]):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-        
-        return await get_vehicles_by_owner_id(db, Request.state.user_id)
+        # The version query is a single indexed aggregate; skip the list query when the client is current
+        etag = await get_owner_vehicles_etag(db, Request.state.user_id, limit, cursor)
+        if etag_matches(Request, etag):
+            return not_modified_response(etag)
+
+        vehicles, next_cursor = await get_vehicles_by_owner_id(db, Request.state.user_id, limit, cursor)
+        # Encode the rows once in the response_model's shape instead of validating them twice
+        result = adapter_response(VEHICLE_OWNER_ROWS, vehicles)
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        set_etag_headers(result, etag)
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -35,18 +73,123 @@ async def owner_vehicles(
 
 
 
-@router.post("/create-vehicle", response_model=VehicleOut, status_code=status.HTTP_201_CREATED)
+@router.get(
+    "/get-vehicles",
+    response_model=list[VehicleOut],
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_READ))],
+)
+async def all_vehicles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    try:
+        vehicles, next_cursor = await list_all_vehicles(db, limit, cursor)
+        result = adapter_response(VEHICLE_ROWS, vehicles)
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/search",
+    response_model=list[VehicleOut],
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_READ))],
+)
+async def search_vehicles(
+    type: Optional[str] = Query(None, pattern="^(bike|car|scooter|scooty|van)$"),
+    availability_status: Optional[str] = Query(None, pattern="^(available|booked|maintenance)$"),
+    rental_duration: Optional[str] = Query(None, pattern="^(hour|day|week|month)$"),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    Search vehicles by type, availability, rental duration and price range, cheapest first;
+    without a price filter, vehicles that have no price come last
+    """
+    try:
+        filters = VehicleSearchFilters(
+            type=type,
+            availability_status=availability_status,
+            rental_duration=rental_duration,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        vehicles, next_cursor = await search_all_vehicles(db, filters, limit, cursor)
+        result = adapter_response(VEHICLE_ROWS, vehicles)
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/availability",
+    response_model=VehicleAvailabilityOut,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_READ))],
+)
+async def vehicle_availability(
+    response: Response,
+    type: Optional[str] = Query(None, pattern="^(bike|car|scooter|scooty|van)$"),
+    availability_status: Optional[str] = Query(None, pattern="^(available|booked|maintenance)$"),
+    rental_duration: Optional[str] = Query(None, pattern="^(hour|day|week|month)$"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+):
+    """Count and list vehicle ids by type, availability and rental duration from the in-memory index"""
+    try:
+        availability, next_cursor = get_vehicle_availability(
+            type, availability_status, rental_duration, limit, cursor
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return availability
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post(
+    "/quote",
+    response_model=VehicleQuoteResult,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_READ))],
+)
+async def vehicle_quotes(
+    payload: VehicleQuoteRequest,
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """Price a booking window for a set of vehicles, applying the discounts from the rental_quote setting"""
+    try:
+        return await quote_vehicles(db, payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post(
+    "/create-vehicle",
+    response_model=VehicleOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_CREATE))],
+)
 async def create_vehicle(
     Request: Request,
     payload: VehicleCreate,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     try:
-            
-        # Check if user has required role (Owner or Admin)
-        if not is_user_type_in_allowed_roles(Request.state.user_type, [Role.OWNER, Role.ADMIN]):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-        
         return await create_new_vehicle(db, Request.state.user_id, payload)
     except HTTPException:
         raise
@@ -54,19 +197,110 @@ async def create_vehicle(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.put("/update-vehicle/{vehicle_id}", response_model=VehicleOut)
+@router.post(
+    "/create-vehicle/upload",
+    response_model=VehicleOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_CREATE))],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["name", "type", "availability_status", "rental_duration"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "type": {"type": "string", "enum": ["bike", "car", "scooter", "scooty", "van"]},
+                            "availability_status": {"type": "string", "enum": ["available", "booked", "maintenance"]},
+                            "rental_duration": {"type": "string", "enum": ["hour", "day", "week", "month"]},
+                            "rental_price": {"type": "number"},
+                            "documents": {
+                                "type": "string",
+                                "description": "JSON array of {document_type, document_number, expiry_date, issue_date}, one per document_image file",
+                            },
+                            "document_image": {"type": "array", "items": {"type": "string", "format": "binary"}},
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def create_vehicle_upload(
+    Request: Request,
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    Create a vehicle from a multipart/form-data body with raw document images instead of base64.
+    Each image is streamed to disk as it arrives, so memory does not grow with image size.
+    """
+    try:
+        return await create_new_vehicle_from_upload(
+            db, Request.state.user_id, Request.headers.get("content-type"), Request.stream()
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post(
+    "/bulk-import",
+    response_model=VehicleImportResult,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_CREATE))],
+)
+async def bulk_import_vehicles(
+    Request: Request,
+    batch_size: int = Query(500, ge=1, le=1000, description="Rows per insert batch and transaction"),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    Import vehicles from an NDJSON (application/x-ndjson) or CSV (text/csv, header row first) body.
+    The body is read as a stream; invalid rows are reported by line number and skipped.
+    """
+    try:
+        return await import_vehicles(
+            db, Request.state.user_id, Request.headers.get("content-type"), Request.stream(), batch_size
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/update-availability-status",
+    response_model=VehicleStatusBulkUpdateResult,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_UPDATE))],
+)
+async def bulk_update_availability_status(
+    Request: Request,
+    payload: VehicleStatusBulkUpdate,
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """Set the availability status of several owned vehicles at once"""
+    try:
+        return await update_availability_statuses(db, Request.state.user_id, payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/update-vehicle/{vehicle_id}",
+    response_model=VehicleOut,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_UPDATE))],
+)
 async def update_vehicle(
     vehicle_id: uuid.UUID,
     Request: Request,
     payload: VehicleUpdate,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     try:
-            
-        # Check if user has required role (Owner or Admin)
-        if not is_user_type_in_allowed_roles(Request.state.user_type, [Role.OWNER, Role.ADMIN]):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-        
         return await edit_vehicle(db, Request.state.user_id, vehicle_id, payload)
     except HTTPException:
         raise
@@ -74,18 +308,17 @@ async def update_vehicle(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.delete("/delete-vehicle/{vehicle_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/delete-vehicle/{vehicle_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission_dependency(Permission.VEHICLE_DELETE))],
+)
 async def delete_vehicle(
     Request: Request,
     vehicle_id: uuid.UUID,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     try:
-            
-        # Check if user has required role (Owner or Admin)
-        if not is_user_type_in_allowed_roles(Request.state.user_type, [Role.OWNER, Role.ADMIN]):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-        
         await remove_vehicle(db, Request.state.user_id, vehicle_id)
         return None
     except HTTPException:
@@ -1,23 +1,30 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+from pydantic import BaseModel, Field, TypeAdapter
 import uuid
 
 
-class DocumentData(BaseModel):
+class DocumentMetadata(BaseModel):
     document_number: Optional[str] = Field(default=None, description="Document number like AZAAP23432")
-    document_image: str = Field(..., description="Base64 encoded document image")
     document_type: str = Field(..., description="Type of document")
     expiry_date: Optional[str] = Field(default=None, description="Expiry date of the document")
     issue_date: Optional[str] = Field(default=None, description="Issue date of the document")
 
 
-class VehicleCreate(BaseModel):
+class DocumentData(DocumentMetadata):
+    document_image: str = Field(..., description="Base64 encoded document image")
+
+
+class VehicleFields(BaseModel):
     name: str = Field(..., description="Name of the vehicle")
     type: str = Field(pattern="^(bike|car|scooter|scooty|van)$")
     availability_status: str = Field(pattern="^(available|booked|maintenance)$")
     rental_duration: str = Field(pattern="^(hour|day|week|month)$")
     rental_price: Optional[float] = None
+
+
+class VehicleCreate(VehicleFields):
     documents: List[DocumentData] = Field(..., description="List of documents required for vehicle registration")
 
 
@@ -30,6 +37,69 @@ class VehicleUpdate(BaseModel):
     documents: Optional[List[DocumentData]] = Field(default=None, description="List of documents to update for vehicle")
 
 
+class VehicleSearchFilters(BaseModel):
+    """Filters supported by the vehicle search endpoint (all optional, combined with AND)"""
+    type: Optional[str] = Field(default=None, pattern="^(bike|car|scooter|scooty|van)$")
+    availability_status: Optional[str] = Field(default=None, pattern="^(available|booked|maintenance)$")
+    rental_duration: Optional[str] = Field(default=None, pattern="^(hour|day|week|month)$")
+    min_price: Optional[float] = Field(default=None, ge=0)
+    max_price: Optional[float] = Field(default=None, ge=0)
+
+
+class VehicleAvailabilityOut(BaseModel):
+    """Availability count and matching vehicle ids served from the in-memory index"""
+    count: int
+    vehicle_ids: List[str]
+
+
+class VehicleStatusBulkUpdate(BaseModel):
+    vehicle_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=500, description="Vehicles to update")
+    availability_status: str = Field(..., pattern="^(available|booked|maintenance)$")
+
+
+class VehicleStatusBulkUpdateResult(BaseModel):
+    updated_ids: List[str] = Field(default_factory=list, description="Vehicles whose status changed")
+    unchanged_ids: List[str] = Field(default_factory=list, description="Vehicles already in the requested status")
+    not_found_ids: List[str] = Field(default_factory=list, description="Vehicles that do not exist or are not owned by the caller")
+
+
+class VehicleQuoteRequest(BaseModel):
+    start: datetime = Field(..., description="Booking start (naive values are treated as UTC)")
+    end: datetime = Field(..., description="Booking end (naive values are treated as UTC)")
+    vehicle_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=500, description="Vehicles to quote")
+
+
+class VehicleQuote(BaseModel):
+    vehicle_id: str
+    rental_duration: str
+    unit_price: Optional[float] = Field(description="Price per rental_duration unit (null if the vehicle has no price)")
+    units: int = Field(description="Whole rental_duration units billed for the window")
+    base_price: Optional[float]
+    discount_percent: float
+    price: Optional[float]
+
+
+class VehicleQuoteResult(BaseModel):
+    start: datetime
+    end: datetime
+    hours: float
+    quotes: List[VehicleQuote]
+    not_found_ids: List[str] = Field(default_factory=list, description="Vehicles that do not exist or are deleted")
+
+
+class VehicleImportError(BaseModel):
+    line: int
+    error: str
+
+
+class VehicleImportResult(BaseModel):
+    total_rows: int = 0
+    created: int = 0
+    failed: int = 0
+    vehicle_ids: List[str] = Field(default_factory=list, description="Ids of created vehicles in input order")
+    errors: List[VehicleImportError] = Field(default_factory=list)
+
+
 class VehicleOut(BaseModel):
     id: uuid.UUID
     name: str
@@ -58,3 +128,33 @@ class VehicleOwnerOut(BaseModel):
     }
 
 
+
+class VehicleRow(TypedDict):
+    """VehicleOut as selected from the vehicles table; serialized without re-validation"""
+    id: str
+    name: str
+    type: str
+    availability_status: str
+    rental_duration: str
+    rental_price: Optional[float]
+    is_deleted: bool
+
+
+class VehicleOwnerRow(TypedDict):
+    """VehicleOwnerOut as selected by the owner vehicle query; serialized without re-validation"""
+    user_vehicle_id: int
+    ownership_type: str
+    vehicle_id: str
+    vehicle_name: str
+    vehicle_type: str
+    rental_duration: str
+    rental_price: Optional[float]
+    availability_status: str
+
+
+# Metadata of multipart document uploads, one entry per file part in body order
+DOCUMENT_METADATA_LIST = TypeAdapter(List[DocumentMetadata])
+
+# Built once at import; encode DB rows straight to JSON bytes in the same shape as the Out models
+VEHICLE_ROWS = TypeAdapter(List[VehicleRow])
+VEHICLE_OWNER_ROWS = TypeAdapter(List[VehicleOwnerRow])
@@ -1,16 +1,58 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .features.auth.routes import router as auth_router
+from .core.config import get_settings
 from .core.middleware import AuthMiddleware
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .utils.etag import ETAG_HEADER
+from .features.auth.revocation import refresh_revocation_map, run_revocation_refresher
+from .features.vehicles.availability import load_availability_index, run_availability_refresher
+from .features.bookings.intervals import load_booking_index
+from .features.documents.storage import run_document_collector
 from .features.vehicles.routes import router as vehicles_router
 from .features.documents.routes import router as documents_router
 from .features.settings.routes import router as settings_router
+from .features.bookings.routes import router as bookings_router
+from .features.admin.routes import router as admin_router
+
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    background_tasks = []
+
+    if settings.auth_mode == "stateless":
+        # Load revocations before serving so revoked tokens are never accepted
+        await refresh_revocation_map()
+        background_tasks.append(asyncio.create_task(
+            run_revocation_refresher(settings.auth_revocation_refresh_seconds)
+        ))
+
+    # Availability counts and lists are served from memory; load them before serving
+    await load_availability_index()
+    background_tasks.append(asyncio.create_task(
+        run_availability_refresher(settings.availability_index_refresh_seconds)
+    ))
+    # Upcoming bookings per vehicle for the fast conflict check; it self-corrects, so no refresher
+    await load_booking_index()
+    # Stored document files are shared by content; remove the ones no document uses any more
+    background_tasks.append(asyncio.create_task(
+        run_document_collector(settings.document_gc_interval_seconds)
+    ))
+
+    yield
 
+    for task in background_tasks:
+        task.cancel()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Rental App Backend", version="0.2.0")
+    app = FastAPI(title="Rental App Backend", version="0.2.0", lifespan=lifespan)
 
     allowed_origins = [
         "*",
@@ -22,6 +64,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
     )
     
     # Add authentication middleware
@@ -41,6 +84,8 @@ def create_app() -> FastAPI:
     app.include_router(vehicles_router)
     app.include_router(documents_router)
     app.include_router(settings_router)
+    app.include_router(bookings_router)
+    app.include_router(admin_router)
     
     return app
 
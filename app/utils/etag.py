@@ -0,0 +1,59 @@
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response, status
+
+ETAG_HEADER = "ETag"
+
+# Clients may keep the body but must revalidate with If-None-Match before reusing it
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that identify one representation of a resource.
+
+    Args:
+        *parts (Any): Resource name, caller, query parameters and version fingerprint
+
+    Returns:
+        str: Quoted entity tag
+    """
+    raw = json.dumps(parts, separators=(",", ":"), default=str).encode()
+    return f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against the current ETag.
+
+    Args:
+        request (Request): Incoming request
+        etag (str): Current ETag of the resource
+
+    Returns:
+        bool: True if the client's copy is current and a 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix added by a proxy still matches
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 response carrying the validator headers a 200 would have sent"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={ETAG_HEADER: etag, "Cache-Control": REVALIDATE_CACHE_CONTROL},
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation policy to a full response"""
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
@@ -1,5 +1,5 @@
 from typing import Union, List
-from ..constants.permissions import Role
+from ..constants.permissions import Role, ROLE_BITS, role_mask
 
 
 def is_user_type_in_allowed_roles(user_type: str, allowed_roles: List[Union[str, Role]]) -> bool:
@@ -13,23 +13,8 @@ def is_user_type_in_allowed_roles(user_type: str, allowed_roles: List[Union[str,
     Returns:
         bool: True if user_type is in allowed_roles, False otherwise
     """
-    try:
-        # Convert user_type to Role enum for comparison
-        user_role = Role(user_type)
-        
-        # Check if user_role is in any of the allowed roles
-        for allowed_role in allowed_roles:
-            # Convert string roles to Role enum if needed
-            if isinstance(allowed_role, str):
-                allowed_role = Role(allowed_role)
-            
-            if user_role == allowed_role:
-                return True
-        
-        return False
-    except ValueError:
-        # If user_type is invalid, return False
-        return False
+    # Invalid user types and roles have no bit set, so they never match
+    return bool(ROLE_BITS.get(user_type, 0) & role_mask(*allowed_roles))
 
 
 def get_valid_user_types() -> List[str]:
@@ -0,0 +1,49 @@
+import base64
+import json
+from typing import Any, List, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode keyset values (the sort key of the last row) into an opaque cursor.
+
+    Args:
+        values (List[Any]): JSON-serializable sort key values
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor (Optional[str]): Cursor from the client, or None for the first page
+        size (int): Expected number of keyset values
+
+    Returns:
+        Optional[List[Any]]: Keyset values, or None for the first page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
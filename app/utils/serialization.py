@@ -0,0 +1,47 @@
+from typing import Any, List, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Result
+
+
+class PydanticJSONResponse(Response):
+    """
+    JSON response whose body was already encoded by a pydantic TypeAdapter.
+
+    Returning it from a route bypasses FastAPI's response_model re-validation and
+    jsonable_encoder pass; response_model still documents the schema in OpenAPI.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if not isinstance(content, bytes):
+            raise TypeError("PydanticJSONResponse expects bytes from TypeAdapter.dump_json")
+        return content
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    value: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> PydanticJSONResponse:
+    """
+    Encode data with a precompiled TypeAdapter in a single pass.
+
+    Args:
+        adapter (TypeAdapter): Adapter built once at import time for the response type
+        value (Any): Data already shaped like that type (e.g. dicts from rows_as_dicts)
+        status_code (int): HTTP status code
+        headers (Optional[Mapping[str, str]]): Extra response headers
+
+    Returns:
+        PydanticJSONResponse: Response carrying the encoded body
+    """
+    return PydanticJSONResponse(adapter.dump_json(value), status_code=status_code, headers=headers)
+
+
+def rows_as_dicts(result: Result) -> List[dict]:
+    """Materialize a Core result as plain dicts keyed by column label (cheaper than Row._asdict)"""
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
@@ -0,0 +1,96 @@
+"""
+Throughput of the pure ASGI AuthMiddleware versus the previous BaseHTTPMiddleware wrapper.
+
+Runs in-process through httpx's ASGI transport; the user cache is pre-warmed so no
+database is needed.
+
+    python -m benchmarks.auth_middleware --requests 5000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import (
+    AuthMiddleware,
+    DEFAULT_EXCLUDED_PATHS,
+    authenticate_request,
+    compile_excluded_paths,
+)
+from app.features.auth.cache import user_cache
+from app.features.auth.repository import create_access_token
+from app.features.auth.schemas import UserOut
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """Previous implementation: BaseHTTPMiddleware + linear excluded-path scan"""
+
+    def __init__(self, app, excluded_paths: list = None):
+        super().__init__(app)
+        self.excluded_paths = excluded_paths or DEFAULT_EXCLUDED_PATHS
+        self.compiled = compile_excluded_paths([])
+
+    async def dispatch(self, request: Request, call_next):
+        if any(request.url.path == path for path in self.excluded_paths):
+            return await call_next(request)
+        await authenticate_request(request, self.compiled)
+        return await call_next(request)
+
+
+def build_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware_class)
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/api/v1/ping")
+    async def ping(request: Request) -> dict:
+        return {"user_id": request.state.user_id}
+
+    return app
+
+
+async def run(app: FastAPI, path: str, headers: dict, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        per_worker = requests // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    user_id = uuid.uuid4()
+    user_cache.set(UserOut(
+        id=user_id, type="owner", status="active", is_deleted=False, added_date=datetime.utcnow(),
+    ))
+    token = create_access_token({"user_id": str(user_id), "type": "owner"})
+    auth_headers = {"Authorization": f"Bearer {token}"}
+
+    cases = [("excluded /health", "/health", {}), ("authenticated", "/api/v1/ping", auth_headers)]
+    print(f"{'case':<20} {'legacy req/s':>14} {'asgi req/s':>14} {'speedup':>9}")
+    for name, path, headers in cases:
+        legacy = await run(build_app(LegacyAuthMiddleware), path, headers, requests, concurrency)
+        asgi = await run(build_app(AuthMiddleware), path, headers, requests, concurrency)
+        print(f"{name:<20} {legacy:>14.0f} {asgi:>14.0f} {asgi / legacy:>8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
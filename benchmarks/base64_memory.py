@@ -0,0 +1,68 @@
+"""
+Peak memory of saving one base64 document image: whole-payload decode vs windowed decode.
+
+Each measurement runs in a fresh child process that builds the base64 payload (as the JSON
+body would), then saves it. Reported numbers are the growth in peak RSS caused by the save
+alone, plus the peak of Python allocations during the save from tracemalloc. The previous
+path split off the data URL prefix and decoded everything at once; the current path is
+decode_base64_to_file.
+
+    python -m benchmarks.base64_memory --sizes-mb 1 5 20
+"""
+import argparse
+import base64
+import multiprocessing
+import os
+import resource
+import tempfile
+import tracemalloc
+
+from app.features.documents.storage import decode_base64_to_file
+
+
+def previous_path(payload: str, file_path: str) -> None:
+    if ',' in payload:
+        payload = payload.split(',')[1]
+    image_data = base64.b64decode(payload)
+    with open(file_path, 'wb') as f:
+        f.write(image_data)
+
+
+def windowed_path(payload: str, file_path: str) -> None:
+    decode_base64_to_file(payload, file_path, max_bytes=1 << 40)
+
+
+PATHS = {"previous": previous_path, "windowed": windowed_path}
+
+
+def measure(name: str, size_mb: int, results) -> None:
+    payload = "data:image/jpeg;base64," + base64.b64encode(os.urandom(size_mb * 1024 * 1024)).decode()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with tempfile.TemporaryDirectory() as directory:
+        tracemalloc.start()
+        PATHS[name](payload, os.path.join(directory, "image.jpg"))
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    # ru_maxrss is in KiB on Linux
+    results.put((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before, traced_peak))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'image MB':>8} {'path':<10} {'RSS growth MB':>14} {'traced peak MB':>15}")
+    for size_mb in args.sizes_mb:
+        for name in PATHS:
+            results = context.Queue()
+            child = context.Process(target=measure, args=(name, size_mb, results))
+            child.start()
+            rss_kib, traced = results.get()
+            child.join()
+            print(f"{size_mb:>8} {name:<10} {rss_kib / 1024:>14.2f} {traced / 1024 / 1024:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
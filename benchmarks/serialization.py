@@ -0,0 +1,98 @@
+"""
+Cost of turning owner-vehicle rows into a JSON response body: the previous path vs the TypeAdapter path.
+
+The previous path copies rows into dicts, validates each into VehicleOwnerOut, then lets FastAPI
+dump, re-validate (response_model) and jsonable_encode them before JSONResponse runs json.dumps.
+The current path turns rows into dicts and encodes them straight to bytes with a precompiled
+TypeAdapter. Rows come from an in-memory SQLite database and are replayed from a frozen result,
+so fetching is not timed.
+
+    python -m benchmarks.serialization --rows 10000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+from app.core.db import Base
+from app.features.models import *  # noqa: F401,F403 - register every table
+from app.features.models.user import User
+from app.features.models.user_vehicle import UserVehicle
+from app.features.models.vehicle import Vehicle
+from app.features.vehicles.repository import build_owner_vehicles_query
+from app.features.vehicles.schemas import VehicleOwnerOut, VEHICLE_OWNER_ROWS
+from app.utils.serialization import adapter_response, rows_as_dicts
+
+RESPONSE_FIELD = create_model_field("Response_owner_vehicles", List[VehicleOwnerOut], mode="serialization")
+
+
+def fetch_rows(rows: int):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    owner_id = str(uuid.uuid4())
+    vehicle_ids = [str(uuid.uuid4()) for _ in range(rows)]
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": owner_id, "name": "owner", "email": "owner@bench.local",
+                                     "phone": "0000000000", "password": "x", "type": "owner"}])
+        conn.execute(insert(Vehicle.__table__), [
+            {"id": vehicle_id, "name": f"vehicle-{i}", "type": "car", "availability_status": "available",
+             "rental_duration": "day", "rental_price": 100 + i % 900, "is_deleted": False}
+            for i, vehicle_id in enumerate(vehicle_ids)
+        ])
+        conn.execute(insert(UserVehicle.__table__), [
+            {"user_id": owner_id, "vehicle_id": vehicle_id, "ownership_type": "owner",
+             "ownership_status": "active", "is_deleted": False}
+            for vehicle_id in vehicle_ids
+        ])
+    with engine.connect() as conn:
+        return conn.execute(build_owner_vehicles_query(owner_id)).freeze()
+
+
+def previous_path(frozen) -> bytes:
+    dicts = [row._asdict() for row in frozen()]
+    models = [VehicleOwnerOut.model_validate(d) for d in dicts]
+    content = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=models))
+    return JSONResponse(content).body
+
+
+def adapter_path(frozen) -> bytes:
+    return adapter_response(VEHICLE_OWNER_ROWS, rows_as_dicts(frozen())).body
+
+
+def measure(func, rows, repeats: int) -> tuple:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        body = func(rows)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[max(int(len(timings) * 0.95) - 1, 0)], len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = fetch_rows(args.rows)
+    print(f"{args.rows} rows")
+    print(f"{'path':<10} {'p50 ms':>9} {'p95 ms':>9} {'bytes':>10}")
+    results = {}
+    for name, func in (("previous", previous_path), ("adapter", adapter_path)):
+        results[name] = measure(func, rows, args.repeats)
+        p50, p95, size = results[name]
+        print(f"{name:<10} {p50:>9.2f} {p95:>9.2f} {size:>10}")
+    print(f"speedup    {results['previous'][0] / results['adapter'][0]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
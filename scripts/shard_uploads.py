@@ -0,0 +1,98 @@
+"""
+Move document files stored directly in uploads/documents into the sharded layout and rewrite their urls.
+
+Works through media_documents_urls by id, --chunk-size rows per transaction: the chunk's rows
+are locked, their files moved into their shard, their urls rewritten in one UPDATE, then it
+commits. Only rows whose url is still flat are selected, so an interrupted run is resumed by
+starting it again (--start-id skips ahead). Uploads and the file collector lock the same rows,
+so it is safe to run while the app serves. Run it from the directory the app runs in.
+
+    python -m scripts.shard_uploads --chunk-size 500
+"""
+import argparse
+import asyncio
+import os
+from collections import Counter
+
+from sqlalchemy import case, select, update
+
+from app.core.db import AsyncSessionLocal, unit_of_work
+from app.features.models import *  # noqa: F401,F403 - register every table
+from app.features.models.media_document_url import MediaDocumentUrl
+from app.features.documents.storage import (
+    UPLOAD_DIR,
+    content_path,
+    document_write_executor,
+    move_to_shard,
+    shard_path,
+)
+
+
+def target_path(url: str, content_hash) -> str:
+    file_name = os.path.basename(url)
+    if content_hash:
+        return content_path(content_hash, os.path.splitext(file_name)[1].lstrip("."))
+    return shard_path(file_name)
+
+
+async def migrate_chunk(after_id: int, chunk_size: int, dry_run: bool):
+    """Migrate the next chunk of flat rows after after_id; returns (last id, outcome counts)"""
+    async with AsyncSessionLocal() as db:
+        async with unit_of_work(db):
+            rows = (await db.execute(
+                select(MediaDocumentUrl.id, MediaDocumentUrl.url, MediaDocumentUrl.content_hash)
+                .filter(
+                    MediaDocumentUrl.id > after_id,
+                    MediaDocumentUrl.is_deleted == False,
+                    MediaDocumentUrl.url.like(f"{UPLOAD_DIR}/%"),
+                    ~MediaDocumentUrl.url.like(f"{UPLOAD_DIR}/%/%"),
+                )
+                .order_by(MediaDocumentUrl.id)
+                .limit(chunk_size)
+                .with_for_update()
+            )).all()
+            if not rows:
+                return None, Counter()
+            targets = {url_id: target_path(url, content_hash) for url_id, url, content_hash in rows}
+            if dry_run:
+                return rows[-1].id, Counter(planned=len(rows))
+
+            outcomes = Counter()
+            for url_id, url, _ in rows:
+                outcomes[await document_write_executor.run(move_to_shard, url, targets[url_id])] += 1
+            # Urls of missing files are rewritten too, so they are not picked up again on resume
+            await db.execute(
+                update(MediaDocumentUrl)
+                .where(MediaDocumentUrl.id.in_(list(targets)))
+                .values(url=case(targets, value=MediaDocumentUrl.id))
+                .execution_options(synchronize_session=False)
+            )
+    return rows[-1].id, outcomes
+
+
+async def run(chunk_size: int, start_id: int, dry_run: bool) -> None:
+    totals = Counter()
+    last_id = start_id
+    while True:
+        chunk_last_id, outcomes = await migrate_chunk(last_id, chunk_size, dry_run)
+        if chunk_last_id is None:
+            break
+        last_id = chunk_last_id
+        totals.update(outcomes)
+        print(f"  up to id {last_id}: " + ", ".join(f"{name} {count}" for name, count in sorted(outcomes.items())))
+    print("done: " + (", ".join(f"{name} {count}" for name, count in sorted(totals.items())) or "nothing to migrate"))
+    if totals["missing"]:
+        print(f"{totals['missing']} rows pointed at files that no longer exist; their urls were rewritten anyway")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=500, help="rows moved and committed per transaction")
+    parser.add_argument("--start-id", type=int, default=0, help="only migrate rows with a larger id")
+    parser.add_argument("--dry-run", action="store_true", help="count the rows to migrate without moving anything")
+    args = parser.parse_args()
+    asyncio.run(run(args.chunk_size, args.start_id, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
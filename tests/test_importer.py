@@ -0,0 +1,33 @@
+import asyncio
+
+from app.features.vehicles.importer import MAX_LINE_CHARS, iter_lines
+
+
+def collect_lines(chunks):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [line async for line in iter_lines(stream())]
+
+    return asyncio.run(collect())
+
+
+def test_oversized_line_within_one_chunk_is_replaced():
+    long_line = b"x" * (MAX_LINE_CHARS + 1)
+    assert collect_lines([b"first\n" + long_line + b"\nlast\n"]) == ["first", None, "last"]
+
+
+def test_oversized_line_across_chunks_is_replaced():
+    half = b"x" * (MAX_LINE_CHARS // 2 + 1)
+    assert collect_lines([b"first\n" + half, half + b"\nlast\n"]) == ["first", None, "last"]
+
+
+def test_oversized_last_line_without_newline_is_replaced():
+    assert collect_lines([b"first\n", b"x" * (MAX_LINE_CHARS + 1)]) == ["first", None]
+
+
+def test_lines_at_the_limit_are_kept():
+    line = "x" * MAX_LINE_CHARS
+    assert collect_lines([line.encode() + b"\r\n", line.encode()]) == [line, line]